@@ -1,5 +1,18 @@
+import json
+
 from mcp_agent.agents.agent import Agent
 
+# Language name mapping
+LANG_NAMES = {
+    "ko": "Korean",
+    "en": "English",
+    "ja": "Japanese",
+    "zh": "Chinese",
+    "es": "Spanish",
+    "fr": "French",
+    "de": "German"
+}
+
 
 def create_telegram_translator_agent(from_lang: str = "ko", to_lang: str = "en"):
     """
@@ -16,19 +29,8 @@ def create_telegram_translator_agent(from_lang: str = "ko", to_lang: str = "en")
         Agent: Telegram message translation agent
     """
 
-    # Language name mapping
-    lang_names = {
-        "ko": "Korean",
-        "en": "English",
-        "ja": "Japanese",
-        "zh": "Chinese",
-        "es": "Spanish",
-        "fr": "French",
-        "de": "German"
-    }
-
-    from_lang_name = lang_names.get(from_lang, from_lang.upper())
-    to_lang_name = lang_names.get(to_lang, to_lang.upper())
+    from_lang_name = LANG_NAMES.get(from_lang, from_lang.upper())
+    to_lang_name = LANG_NAMES.get(to_lang, to_lang.upper())
 
     instruction = f"""You are a professional translator specializing in stock market and trading communications.
 
@@ -141,3 +143,137 @@ async def translate_telegram_message(
         logger = logging.getLogger(__name__)
         logger.error(f"Translation failed: {str(e)}")
         return message  # Fallback to original message
+
+
+def _parse_multi_translation_response(response: str, to_langs: list) -> dict:
+    """
+    Parse the strict-JSON response of a batch translation call
+
+    Strips optional markdown code fences, rescues malformed JSON via
+    json_repair, and keeps only non-empty string values for the requested
+    language codes. Languages absent from the returned dict are the
+    caller's cue to fall back to per-language translation.
+
+    Args:
+        response: Raw LLM response text
+        to_langs: Target language codes requested from the LLM
+
+    Returns:
+        dict: Mapping of language code -> translated message (may be partial)
+
+    Raises:
+        Exception: When the response cannot be parsed as JSON at all
+    """
+    # Strip optional code fences before parsing
+    text = response.strip()
+    if text.startswith("```"):
+        text = text.strip("`")
+        if text.startswith("json"):
+            text = text[4:]
+
+    try:
+        parsed = json.loads(text)
+    except Exception:
+        # Last resort: repair malformed JSON if the library is available
+        import json_repair
+        parsed = json.loads(json_repair.repair_json(text))
+
+    return {
+        lang: parsed[lang].strip()
+        for lang in to_langs
+        if isinstance(parsed.get(lang), str) and parsed[lang].strip()
+    }
+
+
+async def translate_telegram_message_multi(
+    message: str,
+    to_langs: list,
+    model: str = "gpt-5-nano",
+    from_lang: str = "ko"
+) -> dict:
+    """
+    Translate a telegram message into several languages with one LLM call
+
+    Cuts the network round-trips from N (one per language) to 1 by asking
+    for a JSON object keyed by language code. If the JSON response cannot
+    be parsed, falls back to per-language translate_telegram_message calls.
+
+    Args:
+        message: Telegram message to translate
+        to_langs: Target language codes (e.g., ['en', 'ja', 'zh'])
+        model: OpenAI model to use (default: gpt-5-nano for cost efficiency)
+        from_lang: Source language code (default: "ko" for Korean)
+
+    Returns:
+        dict: Mapping of language code -> translated message
+    """
+    import asyncio
+    import logging
+
+    from mcp_agent.workflows.llm.augmented_llm_openai import OpenAIAugmentedLLM
+    from mcp_agent.workflows.llm.augmented_llm import RequestParams
+
+    logger = logging.getLogger(__name__)
+
+    if not to_langs:
+        return {}
+
+    from_lang_name = LANG_NAMES.get(from_lang, from_lang.upper())
+    lang_list = ", ".join(
+        f'"{lang}" ({LANG_NAMES.get(lang, lang.upper())})' for lang in to_langs
+    )
+
+    instruction = f"""You are a professional translator specializing in stock market and trading communications.
+
+Translate the given {from_lang_name} telegram message into ALL of the following languages: {lang_list}.
+
+Follow these guidelines for every language:
+- Keep all line breaks, spacing, bullet points, markdown (*, -, `) and emojis exactly as they appear
+- Preserve all numeric values, percentages and date formats
+- Translate stock market terminology accurately and ALWAYS translate company names to the target language, keeping ticker symbols
+
+Return STRICT JSON only - a single object whose keys are exactly the language codes {json.dumps(to_langs)} and whose values are the full translated messages. No explanations, no markdown code fences.
+"""
+
+    try:
+        agent = Agent(
+            name="telegram_multi_translator",
+            instruction=instruction,
+            server_names=[]
+        )
+        llm = await agent.attach_llm(OpenAIAugmentedLLM)
+
+        response = await llm.generate_str(
+            message=message,
+            request_params=RequestParams(
+                model=model,
+                maxTokens=100000,
+                temperature=0.3,
+                max_iterations=1
+            )
+        )
+
+        translations = _parse_multi_translation_response(response, to_langs)
+
+        missing = [lang for lang in to_langs if lang not in translations]
+        if not missing:
+            return translations
+
+        logger.warning(f"Batch translation missing languages: {missing}, falling back per language")
+
+    except Exception as e:
+        logger.error(f"Batch translation failed: {str(e)}, falling back per language")
+        translations = {}
+        missing = [lang for lang in to_langs if lang not in translations]
+
+    # Per-language fallback for whatever the batch call did not deliver
+    results = await asyncio.gather(
+        *(translate_telegram_message(message, model=model, from_lang=from_lang, to_lang=lang)
+          for lang in missing),
+        return_exceptions=True
+    )
+    for lang, result in zip(missing, results):
+        if isinstance(result, str):
+            translations[lang] = result
+
+    return translations
@@ -4,9 +4,13 @@ Jeon Ingu Trading - Real-time price fetcher using pykrx
 Fetches current prices for KODEX Leverage and KODEX Inverse 2X
 """
 
-from pykrx import stock
-from datetime import datetime, timedelta
+import functools
+import json
 import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from pykrx import stock
 
 logger = logging.getLogger(__name__)
 
@@ -14,14 +18,56 @@ logger = logging.getLogger(__name__)
 KODEX_LEVERAGE = "122630"
 KODEX_INVERSE_2X = "252670"
 
+# Latest trading date changes at most once a day, so cache it on disk to
+# skip the 1-5 blocking KRX probe calls on subsequent runs
+TRADING_DATE_CACHE_FILE = Path(__file__).parent / ".trading_date_cache.json"
+TRADING_DATE_CACHE_TTL_SEC = 4 * 3600
 
-def get_latest_trading_date() -> str:
+
+def _load_cached_trading_date() -> str:
+    """Return the on-disk cached trading date if it is still trustworthy"""
+    try:
+        data = json.loads(TRADING_DATE_CACHE_FILE.read_text(encoding='utf-8'))
+        fetched_at = datetime.fromisoformat(data['fetched_at'])
+        age_sec = (datetime.now() - fetched_at).total_seconds()
+
+        # Only trust entries *written* after the close - a probe made during
+        # the session may still flip from yesterday to today once the day's
+        # data is published, so its result must never be served later
+        if age_sec < TRADING_DATE_CACHE_TTL_SEC and fetched_at.hour >= 16:
+            return data['date']
+    except Exception:
+        pass
+    return ""
+
+
+def _save_cached_trading_date(date_str: str):
+    # Results probed before the close are provisional - persisting them
+    # would let an intraday answer leak into post-close runs
+    if datetime.now().hour < 16:
+        return
+
+    try:
+        TRADING_DATE_CACHE_FILE.write_text(
+            json.dumps({'date': date_str, 'fetched_at': datetime.now().isoformat()}),
+            encoding='utf-8'
+        )
+    except Exception as e:
+        logger.debug(f"Could not write trading date cache: {e}")
+
+
+@functools.lru_cache(maxsize=1)
+def _latest_trading_date(time_bucket: str) -> str:
     """
-    Get latest trading date (excluding weekends and holidays)
+    Resolve the latest trading date, probing KRX only when needed.
 
-    Returns:
-        Date string in YYYYMMDD format
+    time_bucket (YYYYMMDDHH) makes the in-process cache invalidate hourly.
     """
+    cached = _load_cached_trading_date()
+    if cached:
+        logger.debug(f"Latest trading date (cached): {cached}")
+        return cached
+
     today = datetime.now()
 
     # Try today first, then go back up to 5 days
@@ -42,6 +88,7 @@ def get_latest_trading_date() -> str:
             )
             if not test_data.empty:
                 logger.info(f"Latest trading date: {date_str}")
+                _save_cached_trading_date(date_str)
                 return date_str
         except Exception:
             continue
@@ -50,6 +97,43 @@ def get_latest_trading_date() -> str:
     return today.strftime("%Y%m%d")
 
 
+def get_latest_trading_date() -> str:
+    """
+    Get latest trading date (excluding weekends and holidays)
+
+    Cached in-process (hourly bucket) and on disk, so repeated calls in the
+    same run or the same evening cost zero network round-trips.
+
+    Returns:
+        Date string in YYYYMMDD format
+    """
+    return _latest_trading_date(datetime.now().strftime("%Y%m%d%H"))
+
+
+@functools.lru_cache(maxsize=4)
+def _etf_snapshot(date: str):
+    """
+    Fetch the whole ETF market OHLCV table for one date.
+
+    Both tickers this module prices are ETFs, and a single
+    get_etf_ohlcv_by_ticker request covers every listed ETF, so memoizing
+    it per date means any number of price lookups in the same run cost
+    exactly one KRX round-trip.
+    """
+    return stock.get_etf_ohlcv_by_ticker(date)
+
+
+@functools.lru_cache(maxsize=8)
+def _etf_ohlcv(stock_code: str, date: str):
+    """
+    Fetch a single ETF's OHLCV for one date.
+
+    Fallback for codes missing from the per-date snapshot (memoized per
+    code/date).
+    """
+    return stock.get_etf_ohlcv_by_date(date, date, stock_code)
+
+
 def get_stock_price(stock_code: str, date: str = None) -> dict:
     """
     Get stock price information
@@ -65,19 +149,21 @@ def get_stock_price(stock_code: str, date: str = None) -> dict:
         date = get_latest_trading_date()
 
     try:
-        # Get OHLCV data
-        df = stock.get_market_ohlcv_by_date(
-            fromdate=date,
-            todate=date,
-            ticker=stock_code
-        )
+        # Index the ticker out of the shared per-date ETF snapshot
+        df = _etf_snapshot(date)
+
+        if not df.empty and stock_code in df.index:
+            latest = df.loc[stock_code]
+        else:
+            # Not in the snapshot - try a targeted fetch before giving up,
+            # so the ticker never falls through to mock prices
+            etf_df = _etf_ohlcv(stock_code, date)
 
-        if df.empty:
-            logger.warning(f"No data for {stock_code} on {date}")
-            return None
+            if etf_df.empty:
+                logger.warning(f"No data for {stock_code} on {date}")
+                return None
 
-        # Get latest row
-        latest = df.iloc[-1]
+            latest = etf_df.iloc[-1]
 
         return {
             "stock_code": stock_code,
@@ -13,19 +13,29 @@ Use full balance for each trade (all-in strategy).
 
 import os
 import sys
+import hashlib
 import json
 import logging
 import asyncio
+import subprocess
 import yaml
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
 # Third-party imports
+import aiohttp
 import feedparser
+import httpx
+
+try:
+    import orjson  # 3-10x faster serialization, compact UTF-8 output
+except ImportError:
+    orjson = None
 import yt_dlp
-from openai import OpenAI
+from openai import AsyncOpenAI
 from mcp_agent.agents.agent import Agent
 from mcp_agent.app import MCPApp
 from mcp_agent.workflows.llm.augmented_llm import RequestParams
@@ -34,6 +44,8 @@ from mcp_agent.workflows.llm.augmented_llm_openai import OpenAIAugmentedLLM
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
+import aiosqlite
+
 from events.jeoningu_trading_db import JeoninguTradingDB
 from events.jeoningu_price_fetcher import get_current_price
 
@@ -65,9 +77,12 @@ logger = logging.getLogger(__name__)
 
 # Constants
 CHANNEL_ID = "UCznImSIaxZR7fdLCICLdgaQ"  # 전인구경제연구소
-RSS_URL = f"https://www.youtube.com/feeds/videos.xml?channel_id={CHANNEL_ID}"
+RSS_URL_TEMPLATE = "https://www.youtube.com/feeds/videos.xml?channel_id={}"
+RSS_URL = RSS_URL_TEMPLATE.format(CHANNEL_ID)
 VIDEO_HISTORY_FILE = DATA_DIR / "jeoningu_video_history.json"
-AUDIO_FILE = AUDIO_TEMP_DIR / "temp_audio.mp3"
+VIDEO_HISTORY_LIMIT = 500  # keep history (and its JSON I/O) bounded
+RSS_CACHE_FILE = DATA_DIR / ".rss_cache.json"  # ETag/Last-Modified per feed
+ANALYSIS_CACHE_FILE = DATA_DIR / "jeon_analysis_cache.sqlite"
 
 # Trading configuration
 INITIAL_CAPITAL = 10000000  # 1천만원 초기 자본
@@ -76,6 +91,146 @@ INITIAL_CAPITAL = 10000000  # 1천만원 초기 자본
 KODEX_LEVERAGE = "122630"  # KODEX 레버리지
 KODEX_INVERSE_2X = "252670"  # KODEX 200선물인버스2X
 
+# Sentinel marking end-of-stream between pipeline stages
+_PIPELINE_END = object()
+
+
+def _read_json_file(path: Path):
+    """Read a JSON file with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json_file(path: Path, data):
+    """Write a JSON file with orjson when available"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+# Shared pool for blocking I/O (yt-dlp, ffmpeg, file writes) so it never
+# stalls the event loop and doesn't compete with asyncio's default executor
+_IO_POOL = ThreadPoolExecutor(max_workers=4)
+
+# Containers the Whisper API accepts as-is (no re-encode needed)
+WHISPER_SUPPORTED_FORMATS = {'.mp3', '.mp4', '.m4a', '.mpeg', '.mpga', '.wav', '.webm', '.ogg', '.oga', '.flac'}
+
+# Transcripts beyond this are truncated before analysis to bound prompt cost
+MAX_TRANSCRIPT_CHARS = 120000
+
+# Static analysis spec - video metadata/transcript arrive via the user
+# message, so no per-video tokens are interpolated into the instruction
+_AGENT_SPEC = """당신은 전인구경제연구소 콘텐츠를 분석하는 역발상 투자 전문가입니다.
+사용자 메시지로 영상 메타데이터(JSON)와 자막이 주어집니다.
+
+## 분석 과제
+
+### 1단계: 콘텐츠 유형 판별
+전인구 본인이 직접 출연하여 시장 의견을 제시하는 영상인가?
+- "본인의견": 전인구 단독으로 영상을 찍으며 직접 시장 전망 언급
+- "스킵": 인터뷰 형식으로 질의응답이 포함된 경우, 단순 뉴스 요약, 게스트 인터뷰만 있는 경우
+
+### 2단계: 시장 기조 분석
+전인구가 시장에 대해 어떤 기조로 말하는지 판단:
+- "상승": 낙관적 전망, 매수 추천, 긍정적 시그널 강조
+- "하락": 비관적 전망, 매도/관망 추천, 부정적 시그널 강조
+- "중립": 명확한 방향성 없음, 애매한 의견
+
+### 3단계: 역발상 전략 결정
+
+**투자 종목 (2개만 사용)**:
+- KODEX 레버리지 (122630): 코스피 200 지수 2배 추종
+- KODEX 200선물인버스2X (252670): 코스피 200 반대 방향 2배
+
+**전략 규칙**:
+1. 전인구 **상승** 기조 → 반대로 **하락**에 베팅 → **KODEX 200선물인버스2X(252670) 매수**
+2. 전인구 **중립** 기조 → 관망 → **보유 종목 전량 매도 (현금화)**
+3. 전인구 **하락** 기조 → 반대로 **상승**에 베팅 → **KODEX 레버리지(122630) 매수**
+
+**포지션 관리**:
+- 항상 1개 종목만 보유 (122630 또는 252670)
+- 다른 종목으로 전환 시: 기존 보유 종목 매도 → 새 종목 매수
+- 중립일 때: 보유 종목 있으면 무조건 매도
+- 매수 시: **가용 잔액 전액 투자** (올인 전략)
+
+## 출력 형식 (JSON)
+
+반드시 아래 JSON 스키마를 따라 출력하세요 (마크다운 코드블록 없이 순수 JSON만).
+video_info 필드는 사용자 메시지의 메타데이터 값을 그대로 복사하세요:
+
+{
+  "video_info": {
+    "video_id": "<메타데이터 video_id>",
+    "title": "<메타데이터 title>",
+    "video_date": "<메타데이터 video_date>",
+    "video_url": "<메타데이터 video_url>"
+  },
+  "content_type": "본인의견" | "스킵",
+  "jeon_sentiment": "상승" | "하락" | "중립",
+  "jeon_reasoning": "전인구의 핵심 발언을 2-3개 문장으로 요약",
+  "contrarian_action": "인버스2X매수" | "레버리지매수" | "전량매도",
+  "target_stock": {
+    "code": "252670" | "122630" | null,
+    "name": "KODEX 200선물인버스2X" | "KODEX 레버리지" | null
+  },
+  "telegram_summary": "텔레그램 메시지 내용 (5줄 이내, 이모지 포함)"
+}
+
+## 중요 사항
+- **반드시 valid JSON만 출력** (마크다운 코드블록 제거)
+- 자막 내용만 근거로 분석 (추측 금지)
+- 종목은 122630, 252670 중 하나만 선택
+- 중립일 때는 target_stock을 null로 설정
+"""
+
+
+class AnalysisCache:
+    """
+    Persistent KV cache for transcripts and analysis results.
+
+    Reruns (lost history file, retried batch, prompt iteration) would
+    otherwise re-pay the full Whisper + LLM cost; keys are content hashes so
+    a cached entry is reused only while audio/transcript/prompt are unchanged.
+    """
+
+    def __init__(self, db_path: str = str(ANALYSIS_CACHE_FILE)):
+        self.db_path = db_path
+
+    async def initialize(self):
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS kv_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    ts INTEGER NOT NULL
+                )
+            """)
+            await db.commit()
+
+    async def get(self, key: str) -> Optional[str]:
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                async with db.execute("SELECT value FROM kv_cache WHERE key = ?", (key,)) as cursor:
+                    row = await cursor.fetchone()
+                    return row[0] if row else None
+        except Exception as e:
+            logger.warning(f"Cache read error: {e}")
+            return None
+
+    async def set(self, key: str, value: str):
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                await db.execute(
+                    "INSERT OR REPLACE INTO kv_cache (key, value, ts) VALUES (?, ?, ?)",
+                    (key, value, int(datetime.now().timestamp()))
+                )
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"Cache write error: {e}")
+
 
 class JeoninguTrading:
     """Main trading bot for contrarian strategy"""
@@ -94,10 +249,24 @@ class JeoninguTrading:
         if not openai_api_key or openai_api_key == "example key":
             raise ValueError("OPENAI_API_KEY not configured in mcp_agent.secrets.yaml")
 
-        self.openai_client = OpenAI(api_key=openai_api_key)
+        # Persistent connection pool so concurrent Whisper/chat calls reuse
+        # TCP/TLS sessions instead of paying setup cost per request
+        self.openai_client = AsyncOpenAI(
+            api_key=openai_api_key,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+                timeout=httpx.Timeout(600.0, connect=10.0)
+            )
+        )
         self.db = JeoninguTradingDB()
+        self.analysis_cache = AnalysisCache()
         self.use_telegram = use_telegram
 
+        # Local faster-whisper avoids API cost, audio upload and the 25MB
+        # limit entirely; set JEONINGU_LOCAL_WHISPER=0 to force the API path
+        self.use_local_whisper = os.getenv("JEONINGU_LOCAL_WHISPER", "1") != "0"
+        self._whisper_model = None
+
         # Load Telegram config if enabled
         if self.use_telegram:
             self._load_telegram_config()
@@ -116,43 +285,123 @@ class JeoninguTrading:
             logger.warning("Telegram not configured - disabling")
             self.use_telegram = False
 
-    def fetch_latest_videos(self) -> List[Dict[str, str]]:
-        """Fetch videos from RSS feed"""
-        logger.info(f"Fetching RSS: {RSS_URL}")
+    async def fetch_latest_videos(self, channel_ids: Optional[List[str]] = None) -> List[Dict[str, str]]:
+        """
+        Fetch videos from RSS feeds concurrently.
+
+        Accepts multiple channel IDs so additional analyst channels can be
+        added later; feeds are downloaded in parallel with aiohttp and the
+        bytes parsed with feedparser, so N-channel latency stays ~1 RTT.
+        """
+        if channel_ids is None:
+            channel_ids = [CHANNEL_ID]
+
+        urls = [RSS_URL_TEMPLATE.format(cid) for cid in channel_ids]
+        logger.info(f"Fetching RSS for {len(urls)} channel(s)")
+
+        rss_cache = self._load_rss_cache()
+
+        async def fetch_one(session: aiohttp.ClientSession, url: str) -> Optional[List[Dict[str, str]]]:
+            """Returns None when the feed is unchanged (HTTP 304)"""
+            headers = {}
+            cached = rss_cache.get(url, {})
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('modified'):
+                headers['If-Modified-Since'] = cached['modified']
+
+            try:
+                async with session.get(url, headers=headers,
+                                       timeout=aiohttp.ClientTimeout(total=30)) as resp:
+                    if resp.status == 304:
+                        logger.info(f"Feed unchanged (304): {url}")
+                        return None
+                    resp.raise_for_status()
+
+                    rss_cache[url] = {
+                        'etag': resp.headers.get('ETag'),
+                        'modified': resp.headers.get('Last-Modified')
+                    }
+                    feed = feedparser.parse(await resp.text())
+
+                videos = []
+                for entry in feed.entries:
+                    videos.append({
+                        'id': entry.yt_videoid,
+                        'title': entry.title,
+                        'published': entry.published,
+                        'link': entry.link,
+                        'author': entry.author if hasattr(entry, 'author') else 'Unknown'
+                    })
+                return videos
+            except Exception as e:
+                logger.error(f"RSS fetch error for {url}: {e}", exc_info=True)
+                return []
+
         try:
-            feed = feedparser.parse(RSS_URL)
-            videos = []
-            for entry in feed.entries:
-                videos.append({
-                    'id': entry.yt_videoid,
-                    'title': entry.title,
-                    'published': entry.published,
-                    'link': entry.link,
-                    'author': entry.author if hasattr(entry, 'author') else 'Unknown'
-                })
+            async with aiohttp.ClientSession() as session:
+                results = await asyncio.gather(*[fetch_one(session, url) for url in urls])
+
+            self._save_rss_cache(rss_cache)
+
+            # Every feed answered 304 - nothing changed since last run, so
+            # the stored history doubles as the current video list
+            if results and all(r is None for r in results):
+                logger.info("All feeds unchanged, using cached history")
+                return self.load_previous_videos()
+
+            videos = [video for channel_videos in results if channel_videos
+                      for video in channel_videos]
             logger.info(f"Found {len(videos)} videos")
             return videos
         except Exception as e:
             logger.error(f"RSS fetch error: {e}", exc_info=True)
             return []
 
+    def _load_rss_cache(self) -> Dict[str, Dict[str, str]]:
+        """Load per-feed ETag/Last-Modified headers"""
+        if not RSS_CACHE_FILE.exists():
+            return {}
+        try:
+            return _read_json_file(RSS_CACHE_FILE)
+        except Exception:
+            return {}
+
+    def _save_rss_cache(self, cache: Dict[str, Dict[str, str]]):
+        try:
+            _write_json_file(RSS_CACHE_FILE, cache)
+        except Exception as e:
+            logger.debug(f"Could not write RSS cache: {e}")
+
     def load_previous_videos(self) -> List[Dict[str, str]]:
         """Load video history"""
         if not VIDEO_HISTORY_FILE.exists():
             return []
         try:
-            with open(VIDEO_HISTORY_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _read_json_file(VIDEO_HISTORY_FILE)
         except Exception as e:
             logger.error(f"Error loading history: {e}")
             return []
 
-    def save_video_history(self, videos: List[Dict[str, str]]):
-        """Save video history"""
+    def save_video_history(self, videos: List[Dict[str, str]],
+                           previous: Optional[List[Dict[str, str]]] = None):
+        """
+        Save video history.
+
+        Merges with the previous history, dedupes by id (newest first) and
+        keeps only the id/title fields of the most recent entries - the diff
+        in find_new_videos only needs ids, so the file stays small and parse
+        cost stays constant as the channel accumulates videos.
+        """
         try:
-            with open(VIDEO_HISTORY_FILE, 'w', encoding='utf-8') as f:
-                json.dump(videos, f, ensure_ascii=False, indent=2)
-            logger.info(f"Saved {len(videos)} videos")
+            merged = {
+                v['id']: {'id': v['id'], 'title': v.get('title', '')}
+                for v in (videos + (previous or []))
+            }
+            history = list(merged.values())[:VIDEO_HISTORY_LIMIT]
+
+            _write_json_file(VIDEO_HISTORY_FILE, history)
+            logger.info(f"Saved {len(history)} videos")
         except Exception as e:
             logger.error(f"Error saving history: {e}")
 
@@ -163,16 +412,13 @@ class JeoninguTrading:
         logger.info(f"Found {len(new_videos)} new videos")
         return new_videos
 
-    def extract_audio(self, video_url: str) -> Optional[str]:
-        """Extract audio from YouTube using Docker"""
-        logger.info(f"Extracting audio: {video_url}")
+    def extract_audio(self, video_url: str, video_id: str) -> Optional[str]:
+        """Extract audio from YouTube using Docker
 
-        # Clean up old files in audio_temp directory
-        for temp_file in AUDIO_TEMP_DIR.glob('temp_audio.*'):
-            try:
-                temp_file.unlink()
-            except Exception:
-                pass
+        Temp files are namespaced by video_id so concurrent pipeline stages
+        never collide on a shared temp_audio.* path.
+        """
+        logger.info(f"Extracting audio: {video_url}")
 
         # 쿠키 파일 경로
         cookies_file = SECRETS_DIR / "youtube_cookies.txt"
@@ -183,38 +429,50 @@ class JeoninguTrading:
             return None
 
         try:
-            import subprocess
-            
             # Docker로 yt-dlp 실행
-            output_template = "/downloads/temp_audio.%(ext)s"
-            
+            # Download the audio-only stream in its native container (m4a/webm)
+            # - Whisper accepts those directly, so skip the MP3 transcode pass
+            output_template = f"/downloads/temp_audio_{video_id}.%(ext)s"
+
             cmd = [
                 "docker", "run", "--rm",
                 "-v", f"{SECRETS_DIR}:/downloads",
                 "jauderho/yt-dlp",
                 "--cookies", "/downloads/youtube_cookies.txt",
-                "-f", "bestaudio",
-                "-x", "--audio-format", "mp3",
+                "-f", "bestaudio[ext=m4a]/bestaudio",
                 "-o", output_template,
                 video_url
             ]
-            
+
             logger.info(f"Running: {' '.join(cmd)}")
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-            
+
             if result.returncode != 0:
                 logger.error(f"Docker yt-dlp failed: {result.stderr}")
                 return None
-            
-            # 결과 파일 찾기 (SECRETS_DIR에 생성됨)
-            output_file = SECRETS_DIR / "temp_audio.mp3"
-            if output_file.exists():
+
+            # 결과 파일 찾기 (SECRETS_DIR에 생성됨) - 확장자는 소스 스트림에 따라 다름
+            output_files = list(SECRETS_DIR.glob(f"temp_audio_{video_id}.*"))
+            if output_files:
+                output_file = output_files[0]
                 # AUDIO_TEMP_DIR로 이동
-                target_file = AUDIO_TEMP_DIR / "temp_audio.mp3"
+                target_file = AUDIO_TEMP_DIR / output_file.name
                 output_file.rename(target_file)
+
+                # Re-encode to MP3 only when Whisper can't take the container
+                if target_file.suffix.lower() not in WHISPER_SUPPORTED_FORMATS:
+                    logger.info(f"Container {target_file.suffix} not Whisper-supported, converting to mp3")
+                    mp3_file = AUDIO_TEMP_DIR / f"temp_audio_{video_id}.mp3"
+                    subprocess.run(
+                        ["ffmpeg", "-y", "-i", str(target_file), "-loglevel", "error", str(mp3_file)],
+                        check=True, timeout=300
+                    )
+                    target_file.unlink()
+                    target_file = mp3_file
+
                 logger.info(f"Audio extraction successful: {target_file}")
                 return str(target_file)
-            
+
             logger.error("Output file not found after docker run")
             return None
             
@@ -225,25 +483,166 @@ class JeoninguTrading:
             logger.error(f"Audio extraction error: {e}")
             return None
 
-    def transcribe_audio(self, audio_file: str) -> Optional[str]:
+    def _probe_duration(self, audio_file: str) -> Optional[float]:
+        """Get audio duration in seconds via ffprobe (no decode)"""
+        try:
+            result = subprocess.run(
+                ["ffprobe", "-v", "error",
+                 "-show_entries", "format=duration",
+                 "-of", "default=nw=1:nk=1",
+                 audio_file],
+                capture_output=True, text=True, timeout=30
+            )
+            if result.returncode == 0 and result.stdout.strip():
+                return float(result.stdout.strip())
+        except Exception:
+            pass
+        logger.debug("Could not determine audio duration")
+        return None
+
+    async def _compress_audio(self, audio_file: str) -> Optional[str]:
+        """
+        Re-encode to 16kHz mono 16kbps Opus before upload.
+
+        Whisper operates internally at 16kHz mono, so this ~10x payload
+        reduction costs no accuracy - a 60-minute video fits in one call.
+        """
+        compressed_file = AUDIO_TEMP_DIR / f"{Path(audio_file).stem}_compressed.ogg"
+        cmd = [
+            "ffmpeg", "-y", "-i", audio_file,
+            "-ac", "1", "-ar", "16000",
+            "-c:a", "libopus", "-b:a", "16k",
+            "-loglevel", "error",
+            str(compressed_file)
+        ]
+        try:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(
+                _IO_POOL, lambda: subprocess.run(cmd, check=True, timeout=300)
+            )
+            return str(compressed_file)
+        except Exception as e:
+            logger.warning(f"Audio compression failed: {e}")
+            return None
+
+    def _transcribe_local(self, audio_file: str) -> Optional[str]:
+        """Transcribe with local faster-whisper (no size limit, no API cost)"""
+        from faster_whisper import WhisperModel
+
+        if self._whisper_model is None:
+            logger.info("Loading faster-whisper model (large-v3, int8)...")
+            self._whisper_model = WhisperModel("large-v3", device="auto", compute_type="int8")
+
+        segments, info = self._whisper_model.transcribe(
+            audio_file,
+            language="ko",
+            vad_filter=True,
+            beam_size=5
+        )
+        text = " ".join(segment.text.strip() for segment in segments)
+        logger.info(f"Local transcription completed ({info.duration:.0f}s audio, {len(text)} chars)")
+        return text or None
+
+    async def _remove_silence(self, audio_file: str) -> Optional[str]:
+        """
+        Strip non-speech regions before uploading to Whisper.
+
+        Economy videos carry 20-40% intro music/silence/outro; dropping it
+        cuts API minutes proportionally and avoids Whisper hallucinating in
+        low-energy regions. ffmpeg's silenceremove keeps 200ms of each
+        removed gap so word boundaries aren't clipped.
+        """
+        suffix = Path(audio_file).suffix or ".mp3"
+        speech_file = AUDIO_TEMP_DIR / f"{Path(audio_file).stem}_speech{suffix}"
+        cmd = [
+            "ffmpeg", "-y", "-i", audio_file,
+            "-af", "silenceremove=stop_periods=-1:stop_duration=0.5:stop_threshold=-40dB:stop_silence=0.2",
+            "-loglevel", "error",
+            str(speech_file)
+        ]
+        try:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(
+                _IO_POOL, lambda: subprocess.run(cmd, check=True, timeout=300)
+            )
+            original_mb = Path(audio_file).stat().st_size / 1024 / 1024
+            speech_mb = speech_file.stat().st_size / 1024 / 1024
+            logger.info(f"Silence removal: {original_mb:.2f}MB -> {speech_mb:.2f}MB")
+            return str(speech_file)
+        except Exception as e:
+            logger.warning(f"Silence removal failed, using original audio: {e}")
+            return None
+
+    @staticmethod
+    def _file_sha256(path: str) -> str:
+        """Content hash of a file (streamed, constant memory)"""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    async def transcribe_audio(self, audio_file: str) -> Optional[str]:
+        """Transcribe audio with Whisper (cached by audio content hash)"""
+        loop = asyncio.get_event_loop()
+        audio_hash = await loop.run_in_executor(_IO_POOL, self._file_sha256, audio_file)
+
+        cached = await self.analysis_cache.get(f"transcript:{audio_hash}")
+        if cached:
+            logger.info("Transcript cache hit, skipping Whisper")
+            return cached
+
+        transcript = await self._do_transcribe(audio_file)
+        if transcript:
+            await self.analysis_cache.set(f"transcript:{audio_hash}", transcript)
+        return transcript
+
+    async def _do_transcribe(self, audio_file: str) -> Optional[str]:
         """Transcribe audio with Whisper"""
         logger.info(f"Transcribing: {audio_file}")
 
+        # Prefer local faster-whisper when available - handles long audio
+        # natively, so the whole split/compress path below is skipped
+        if self.use_local_whisper:
+            try:
+                loop = asyncio.get_event_loop()
+                return await loop.run_in_executor(_IO_POOL, self._transcribe_local, audio_file)
+            except ImportError:
+                logger.info("faster-whisper not installed, using OpenAI Whisper API")
+                self.use_local_whisper = False
+            except Exception as e:
+                logger.warning(f"Local transcription failed ({e}), falling back to OpenAI API")
+
         try:
-            file_size = Path(audio_file).stat().st_size
-            file_size_mb = file_size / 1024 / 1024
+            # Pre-filter silence for the API path (local whisper runs its
+            # own VAD, so this only matters for uploads)
+            speech_file = await self._remove_silence(audio_file)
+            if speech_file:
+                audio_file = speech_file
+
             max_size = 20 * 1024 * 1024  # 20MB (보수적으로 설정)
 
-            logger.info(f"File size: {file_size_mb:.2f}MB")
-            
-            # Try to get audio duration
-            try:
-                from pydub import AudioSegment
-                audio = AudioSegment.from_mp3(audio_file)
-                duration_sec = len(audio) / 1000
+            duration_sec = self._probe_duration(audio_file)
+            if duration_sec:
                 logger.info(f"Audio duration: {duration_sec / 60:.1f} minutes ({duration_sec:.0f}s)")
-            except Exception:
-                logger.debug("Could not determine audio duration")
+
+            # Audio this long can't fit in one call even at 16kbps - go
+            # straight to the combined encode+segment pass rather than
+            # compressing first and re-encoding the chunks
+            if duration_sec and duration_sec * 16000 / 8 > 20 * 1024 * 1024:
+                logger.info("Audio too long for a single call, splitting...")
+                return await self._transcribe_large_file(audio_file)
+
+            # Shrink the upload to what Whisper actually uses (16kHz mono);
+            # at 16kbps Opus only 3+ hour videos still exceed the limit
+            source_file = audio_file
+            compressed_file = await self._compress_audio(audio_file)
+            if compressed_file:
+                audio_file = compressed_file
+
+            file_size = Path(audio_file).stat().st_size
+            file_size_mb = file_size / 1024 / 1024
+            logger.info(f"Upload size: {file_size_mb:.2f}MB")
 
             if file_size <= max_size:
                 logger.info("Sending file to OpenAI Whisper API... (this may take several minutes for long audio)")
@@ -251,65 +650,88 @@ class JeoninguTrading:
                 start_time = time.time()
                 
                 with open(audio_file, "rb") as f:
-                    result = self.openai_client.audio.transcriptions.create(
+                    result = await self.openai_client.audio.transcriptions.create(
                         model="whisper-1",
                         file=f,
                         language="ko",
                         timeout=600.0  # 10분 타임아웃 (긴 오디오 대비)
                     )
-                
+
                 elapsed = time.time() - start_time
                 logger.info(f"Transcription completed in {elapsed:.1f}s ({len(result.text)} chars)")
                 return result.text
             else:
-                # Split large files
+                # Split large files (from the pre-compression source, so the
+                # combined pass doesn't transcode Opus twice)
                 logger.info(f"File size {file_size_mb:.2f}MB exceeds 20MB limit, splitting...")
-                return self._transcribe_large_file(audio_file)
+                return await self._transcribe_large_file(source_file)
 
         except Exception as e:
             logger.error(f"Transcription error: {e}", exc_info=True)
             return None
 
-    def _transcribe_large_file(self, audio_file: str) -> Optional[str]:
+    async def _transcribe_chunk(self, chunk_file: Path, idx: int, total: int,
+                                semaphore: asyncio.Semaphore) -> str:
+        """Transcribe a single chunk (bounded by semaphore)"""
+        async with semaphore:
+            logger.info(f"Transcribing chunk {idx}/{total}")
+            try:
+                with open(chunk_file, "rb") as f:
+                    result = await self.openai_client.audio.transcriptions.create(
+                        model="whisper-1",
+                        file=f,
+                        language="ko"
+                    )
+                return result.text
+            except Exception as e:
+                logger.error(f"Chunk {idx} error: {e}")
+                return f"[Chunk {idx} failed]"
+
+    async def _transcribe_large_file(self, audio_file: str) -> Optional[str]:
         """Split and transcribe large audio files"""
         try:
-            from pydub import AudioSegment
-
-            audio = AudioSegment.from_mp3(audio_file)
-            chunk_length_ms = 5 * 60 * 1000  # 5분 (20MB 제한을 고려한 안전한 크기)
-            chunks = []
-            transcripts = []
+            # Chunk names derive from the per-video source stem, so
+            # concurrent pipelines never touch each other's chunks.
+            stem = Path(audio_file).stem
 
-            total_duration_sec = len(audio) / 1000
-            num_chunks = (len(audio) + chunk_length_ms - 1) // chunk_length_ms
-            logger.info(f"Audio duration: {total_duration_sec:.1f}s, splitting into {num_chunks} chunks")
+            # Remove stale chunks from previous runs
+            for stale in AUDIO_TEMP_DIR.glob(f'{stem}_chunk_*.ogg'):
+                try:
+                    stale.unlink()
+                except Exception:
+                    pass
 
-            for i in range(0, len(audio), chunk_length_ms):
-                chunk = audio[i:i + chunk_length_ms]
-                chunk_file = AUDIO_TEMP_DIR / f"temp_audio_chunk_{i//chunk_length_ms}.mp3"
-                chunk.export(chunk_file, format="mp3")
-                
-                # Verify chunk size doesn't exceed 20MB
-                chunk_size = chunk_file.stat().st_size
-                if chunk_size > 20 * 1024 * 1024:
-                    logger.warning(f"Chunk {i//chunk_length_ms} size {chunk_size / 1024 / 1024:.2f}MB exceeds 20MB!")
-                    # Continue anyway, but log the warning
-                
-                chunks.append(chunk_file)
+            # One ffmpeg invocation does everything: loudness normalization,
+            # 16kHz mono downmix, Opus encode and segmenting. One process
+            # startup and one decode pass instead of a compress pass plus a
+            # split pass (or N per-chunk spawns).
+            chunk_pattern = AUDIO_TEMP_DIR / f"{stem}_chunk_%03d.ogg"
+            cmd = [
+                "ffmpeg", "-y", "-i", audio_file,
+                "-af", "loudnorm=I=-16:LRA=11,aresample=16000",
+                "-ac", "1", "-c:a", "libopus", "-b:a", "16k",
+                "-f", "segment", "-segment_time", "600",
+                "-loglevel", "error",
+                str(chunk_pattern)
+            ]
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(
+                _IO_POOL, lambda: subprocess.run(cmd, check=True, timeout=600)
+            )
 
-            for idx, chunk_file in enumerate(chunks, 1):
-                logger.info(f"Transcribing chunk {idx}/{len(chunks)}")
-                try:
-                    with open(chunk_file, "rb") as f:
-                        result = self.openai_client.audio.transcriptions.create(
-                            model="whisper-1",
-                            file=f,
-                            language="ko"
-                        )
-                    transcripts.append(result.text)
-                except Exception as e:
-                    logger.error(f"Chunk {idx} error: {e}")
-                    transcripts.append(f"[Chunk {idx} failed]")
+            chunks = sorted(AUDIO_TEMP_DIR.glob(f'{stem}_chunk_*.ogg'))
+            if not chunks:
+                logger.error("ffmpeg produced no chunks")
+                return None
+            logger.info(f"Split into {len(chunks)} chunks")
+
+            # Transcribe all chunks concurrently - each call is pure I/O wait.
+            # Semaphore caps in-flight requests to respect OpenAI limits.
+            semaphore = asyncio.Semaphore(5)
+            transcripts = await asyncio.gather(
+                *[self._transcribe_chunk(chunk_file, idx, len(chunks), semaphore)
+                  for idx, chunk_file in enumerate(chunks, 1)]
+            )
 
             # Cleanup
             for chunk_file in chunks:
@@ -321,14 +743,14 @@ class JeoninguTrading:
             logger.info(f"Large file transcription completed: {len(transcripts)} chunks processed")
             return " ".join(transcripts)
 
-        except ImportError:
-            logger.error("pydub not installed. Install: pip install pydub")
+        except subprocess.CalledProcessError as e:
+            logger.error(f"ffmpeg split failed: {e}")
             return None
         except Exception as e:
             logger.error(f"Large file transcription error: {e}")
             return None
 
-    def create_analysis_agent(self, video_info: Dict, transcript: str) -> Agent:
+    def create_analysis_agent(self) -> Agent:
         """
         Create AI agent for analysis
 
@@ -336,81 +758,13 @@ class JeoninguTrading:
         - Jeon UP → Inverse 2X (252670)
         - Jeon NEUTRAL → Sell all
         - Jeon DOWN → Leverage (122630)
-        """
-        instruction = f"""당신은 전인구경제연구소 콘텐츠를 분석하는 역발상 투자 전문가입니다.
-
-## 영상 정보
-- 제목: {video_info['title']}
-- 게시일: {video_info['published']}
-- URL: {video_info['link']}
-
-## 영상 자막
-{transcript}
-
-## 분석 과제
-
-### 1단계: 콘텐츠 유형 판별
-전인구 본인이 직접 출연하여 시장 의견을 제시하는 영상인가?
-- "본인의견": 전인구 단독으로 영상을 찍으며 직접 시장 전망 언급
-- "스킵": 인터뷰 형식으로 질의응답이 포함된 경우, 단순 뉴스 요약, 게스트 인터뷰만 있는 경우
-
-### 2단계: 시장 기조 분석
-전인구가 시장에 대해 어떤 기조로 말하는지 판단:
-- "상승": 낙관적 전망, 매수 추천, 긍정적 시그널 강조
-- "하락": 비관적 전망, 매도/관망 추천, 부정적 시그널 강조
-- "중립": 명확한 방향성 없음, 애매한 의견
-
-### 3단계: 역발상 전략 결정
-
-**투자 종목 (2개만 사용)**:
-- KODEX 레버리지 (122630): 코스피 200 지수 2배 추종
-- KODEX 200선물인버스2X (252670): 코스피 200 반대 방향 2배
-
-**전략 규칙**:
-1. 전인구 **상승** 기조 → 반대로 **하락**에 베팅 → **KODEX 200선물인버스2X(252670) 매수**
-2. 전인구 **중립** 기조 → 관망 → **보유 종목 전량 매도 (현금화)**
-3. 전인구 **하락** 기조 → 반대로 **상승**에 베팅 → **KODEX 레버리지(122630) 매수**
-
-**포지션 관리**:
-- 항상 1개 종목만 보유 (122630 또는 252670)
-- 다른 종목으로 전환 시: 기존 보유 종목 매도 → 새 종목 매수
-- 중립일 때: 보유 종목 있으면 무조건 매도
-- 매수 시: **가용 잔액 전액 투자** (올인 전략)
-
-## 출력 형식 (JSON)
-
-반드시 아래 JSON 스키마를 따라 출력하세요 (마크다운 코드블록 없이 순수 JSON만):
-
-```json
-{{
-  "video_info": {{
-    "video_id": "{video_info['id']}",
-    "title": "{video_info['title']}",
-    "video_date": "{video_info['published']}",
-    "video_url": "{video_info['link']}"
-  }},
-  "content_type": "본인의견" | "스킵",
-  "jeon_sentiment": "상승" | "하락" | "중립",
-  "jeon_reasoning": "전인구의 핵심 발언을 2-3개 문장으로 요약",
-  "contrarian_action": "인버스2X매수" | "레버리지매수" | "전량매도",
-  "target_stock": {{
-    "code": "252670" | "122630" | null,
-    "name": "KODEX 200선물인버스2X" | "KODEX 레버리지" | null
-  }},
-  "telegram_summary": "텔레그램 메시지 내용 (5줄 이내, 이모지 포함)"
-}}
-```
-
-## 중요 사항
-- **반드시 valid JSON만 출력** (마크다운 코드블록 제거)
-- 자막 내용만 근거로 분석 (추측 금지)
-- 종목은 122630, 252670 중 하나만 선택
-- 중립일 때는 target_stock을 null로 설정
-"""
 
+        The spec is static; video metadata and the transcript are supplied
+        in the user message so the instruction carries no per-video tokens.
+        """
         return Agent(
             name="jeoningu_analyst",
-            instruction=instruction,
+            instruction=_AGENT_SPEC,
             server_names=[]
         )
 
@@ -419,13 +773,42 @@ class JeoninguTrading:
         logger.info(f"Analyzing: {video_info['title']}")
 
         try:
-            agent = self.create_analysis_agent(video_info, transcript)
+            agent = self.create_analysis_agent()
+
+            # Bound prompt cost for marathon videos
+            if len(transcript) > MAX_TRANSCRIPT_CHARS:
+                logger.warning(f"Transcript {len(transcript)} chars, truncating to {MAX_TRANSCRIPT_CHARS}")
+                transcript = transcript[:MAX_TRANSCRIPT_CHARS]
+
+            # Keyed by video + transcript + prompt hashes: reruns are free,
+            # and editing the prompt naturally invalidates the entry
+            cache_key = "analysis:" + hashlib.sha256(
+                (video_info['id']
+                 + hashlib.sha256(transcript.encode()).hexdigest()
+                 + hashlib.sha256(agent.instruction.encode()).hexdigest()).encode()
+            ).hexdigest()
+
+            cached = await self.analysis_cache.get(cache_key)
+            if cached:
+                logger.info("Analysis cache hit, skipping LLM call")
+                return json.loads(cached)
+
+            # Compact metadata blob + transcript - the static spec lives in
+            # the agent instruction and is never re-interpolated per video
+            metadata = json.dumps({
+                'video_id': video_info['id'],
+                'title': video_info['title'],
+                'video_date': video_info['published'],
+                'video_url': video_info['link']
+            }, ensure_ascii=False)
+            message = f"## 영상 메타데이터\n{metadata}\n\n## 영상 자막\n{transcript}"
+
             app = MCPApp(name="jeoningu_analysis")
 
             async with app.run() as _:
                 llm = await agent.attach_llm(OpenAIAugmentedLLM)
                 result = await llm.generate_str(
-                    message="위 지시사항에 따라 영상을 분석하고 역발상 투자 전략을 JSON 형식으로 출력해주세요.",
+                    message=message,
                     request_params=RequestParams(
                         model="gpt-4.1",
                         maxTokens=8000,
@@ -446,6 +829,7 @@ class JeoninguTrading:
             result_clean = result_clean.strip()
 
             analysis = json.loads(result_clean)
+            await self.analysis_cache.set(cache_key, json.dumps(analysis, ensure_ascii=False))
             logger.info("Analysis completed")
             return analysis
 
@@ -843,9 +1227,9 @@ https://stocksimulation.kr/ 접속 후
         except Exception as e:
             logger.error(f"Trading execution error: {e}", exc_info=True)
 
-    def cleanup_temp_files(self):
-        """Cleanup temporary audio files"""
-        for temp_file in AUDIO_TEMP_DIR.glob('temp_audio*'):
+    def cleanup_temp_files(self, video_id: str):
+        """Cleanup temporary audio files belonging to one video"""
+        for temp_file in AUDIO_TEMP_DIR.glob(f'temp_audio_{video_id}*'):
             try:
                 temp_file.unlink()
                 logger.debug(f"Cleaned up: {temp_file.name}")
@@ -857,24 +1241,21 @@ https://stocksimulation.kr/ 접속 후
         logger.info(f"Processing: {video_info['title']}")
 
         try:
-            # Extract audio
-            audio_file = self.extract_audio(video_info['link'])
+            # Extract audio (blocking yt-dlp runs off the event loop)
+            loop = asyncio.get_event_loop()
+            audio_file = await loop.run_in_executor(
+                _IO_POOL, self.extract_audio, video_info['link'], video_info['id']
+            )
             if not audio_file:
                 return None
 
             # Transcribe
-            transcript = self.transcribe_audio(audio_file)
+            transcript = await self.transcribe_audio(audio_file)
             if not transcript:
                 return None
 
             # Save transcript to transcripts directory
-            transcript_file = TRANSCRIPTS_DIR / f"transcript_{video_info['id']}.txt"
-            with open(transcript_file, 'w', encoding='utf-8') as f:
-                f.write(f"Video: {video_info['title']}\n")
-                f.write(f"URL: {video_info['link']}\n")
-                f.write(f"Date: {video_info['published']}\n\n")
-                f.write(transcript)
-            logger.info(f"Transcript saved: {transcript_file.name}")
+            self._save_transcript(video_info, transcript)
 
             # Analyze
             analysis = await self.analyze_video(video_info, transcript)
@@ -901,7 +1282,106 @@ https://stocksimulation.kr/ 접속 후
             logger.error(f"Video processing error: {e}", exc_info=True)
             return None
         finally:
-            self.cleanup_temp_files()
+            self.cleanup_temp_files(video_info['id'])
+
+    async def _downloader(self, download_queue: asyncio.Queue, transcribe_queue: asyncio.Queue):
+        """Pipeline stage 1: extract audio (blocking yt-dlp runs in executor)"""
+        loop = asyncio.get_event_loop()
+        while True:
+            video_info = await download_queue.get()
+            if video_info is _PIPELINE_END:
+                await transcribe_queue.put(_PIPELINE_END)
+                break
+            try:
+                audio_file = await loop.run_in_executor(
+                    _IO_POOL, self.extract_audio, video_info['link'], video_info['id']
+                )
+                if audio_file:
+                    await transcribe_queue.put((video_info, audio_file))
+                else:
+                    logger.error(f"Download failed for {video_info['id']}")
+            except Exception as e:
+                logger.error(f"Downloader error for {video_info['id']}: {e}", exc_info=True)
+
+    async def _transcriber(self, transcribe_queue: asyncio.Queue, analyze_queue: asyncio.Queue):
+        """Pipeline stage 2: transcribe audio with Whisper"""
+        while True:
+            item = await transcribe_queue.get()
+            if item is _PIPELINE_END:
+                await analyze_queue.put(_PIPELINE_END)
+                break
+            video_info, audio_file = item
+            try:
+                transcript = await self.transcribe_audio(audio_file)
+                if transcript:
+                    self._save_transcript(video_info, transcript)
+                    await analyze_queue.put((video_info, transcript))
+                else:
+                    logger.error(f"Transcription failed for {video_info['id']}")
+            except Exception as e:
+                logger.error(f"Transcriber error for {video_info['id']}: {e}", exc_info=True)
+            finally:
+                self.cleanup_temp_files(video_info['id'])
+
+    async def _analyzer(self, analyze_queue: asyncio.Queue, results: List[Dict]):
+        """Pipeline stage 3: analyze, notify, and trade (in arrival order)"""
+        while True:
+            item = await analyze_queue.get()
+            if item is _PIPELINE_END:
+                break
+            video_info, transcript = item
+            try:
+                analysis = await self.analyze_video(video_info, transcript)
+                if not analysis:
+                    continue
+
+                if analysis.get('content_type') == '스킵':
+                    logger.info("Content type '스킵', skipping")
+                    results.append(analysis)
+                    continue
+
+                await self.send_telegram_message(analysis)
+                await self.execute_trading_strategy(analysis)
+                await self.send_portfolio_status_message()
+                results.append(analysis)
+            except Exception as e:
+                logger.error(f"Analyzer error for {video_info['id']}: {e}", exc_info=True)
+
+    def _save_transcript(self, video_info: Dict, transcript: str):
+        """Save transcript to transcripts directory"""
+        transcript_file = TRANSCRIPTS_DIR / f"transcript_{video_info['id']}.txt"
+        with open(transcript_file, 'w', encoding='utf-8') as f:
+            f.write(f"Video: {video_info['title']}\n")
+            f.write(f"URL: {video_info['link']}\n")
+            f.write(f"Date: {video_info['published']}\n\n")
+            f.write(transcript)
+        logger.info(f"Transcript saved: {transcript_file.name}")
+
+    async def process_videos_pipelined(self, videos: List[Dict]) -> List[Dict]:
+        """
+        Process videos through a 3-stage async pipeline.
+
+        Download, transcription, and analysis run as decoupled workers linked
+        by queues, so video N+1 downloads while video N transcribes and video
+        N-1 is analyzed. The analyzer stage consumes in queue order, which
+        keeps trade execution chronological.
+        """
+        download_queue: asyncio.Queue = asyncio.Queue()
+        transcribe_queue: asyncio.Queue = asyncio.Queue(maxsize=3)
+        analyze_queue: asyncio.Queue = asyncio.Queue(maxsize=3)
+        results: List[Dict] = []
+
+        for video in videos:
+            download_queue.put_nowait(video)
+        download_queue.put_nowait(_PIPELINE_END)
+
+        await asyncio.gather(
+            self._downloader(download_queue, transcribe_queue),
+            self._transcriber(transcribe_queue, analyze_queue),
+            self._analyzer(analyze_queue, results)
+        )
+
+        return results
 
     async def process_single_video_url(self, video_url: str):
         """Test mode: process single video"""
@@ -911,6 +1391,7 @@ https://stocksimulation.kr/ 접속 후
 
         try:
             await self.db.initialize()
+            await self.analysis_cache.initialize()
 
             video_info = {
                 'title': 'Test Video',
@@ -940,9 +1421,10 @@ https://stocksimulation.kr/ 접속 후
 
         try:
             await self.db.initialize()
+            await self.analysis_cache.initialize()
 
             # Fetch videos
-            current_videos = self.fetch_latest_videos()
+            current_videos = await self.fetch_latest_videos()
             if not current_videos:
                 logger.warning("No videos found")
                 return
@@ -968,14 +1450,15 @@ https://stocksimulation.kr/ 접속 후
             new_videos_chronological = list(reversed(new_videos))
             logger.info(f"Processing {len(new_videos_chronological)} videos in chronological order")
 
-            # Process each new video
-            for video in new_videos_chronological:
-                analysis = await self.process_new_video(video)
-                if analysis:
-                    print(json.dumps(analysis, ensure_ascii=False, indent=2))
+            # Process through the 3-stage pipeline so download, transcription
+            # and analysis overlap across videos
+            results = await self.process_videos_pipelined(new_videos_chronological)
+
+            for analysis in results:
+                print(json.dumps(analysis, ensure_ascii=False, indent=2))
 
             # Save history
-            self.save_video_history(current_videos)
+            self.save_video_history(current_videos, previous_videos)
 
             logger.info("="*80)
             logger.info("Completed")
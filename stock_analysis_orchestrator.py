@@ -11,36 +11,98 @@ Overall Process:
 """
 import argparse
 import asyncio
+import functools
 import json
 import logging
 import os
 import re
 import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-# Logger configuration
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(f"orchestrator_{datetime.now().strftime('%Y%m%d')}.log")
-    ]
-)
+from aiolimiter import AsyncLimiter
+
+try:
+    import orjson  # SIMD-accelerated parsing for trigger result files
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def _configure_logging():
+    """
+    Configure console + daily file logging.
+
+    Called from the entry points only, so importing this module (e.g. in
+    tests) opens no log file and touches no handlers. Idempotent: a second
+    call returns before constructing handlers, so no duplicate log file
+    handle is opened (basicConfig would silently discard it anyway).
+    """
+    if logging.getLogger().handlers:
+        return
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(),
+            logging.FileHandler(f"orchestrator_{datetime.now().strftime('%Y%m%d')}.log")
+        ]
+    )
+
 # Environment configuration
 REPORTS_DIR = Path("reports")
 TELEGRAM_MSGS_DIR = Path("telegram_messages")
 PDF_REPORTS_DIR = Path("pdf_reports")
 
+# Max telegram summaries generated concurrently (LLM provider rate limit guard)
+SUMMARY_CONCURRENCY = 5
+
 # Create directories
 REPORTS_DIR.mkdir(exist_ok=True)
 TELEGRAM_MSGS_DIR.mkdir(exist_ok=True)
 PDF_REPORTS_DIR.mkdir(exist_ok=True)
 (TELEGRAM_MSGS_DIR / "sent").mkdir(exist_ok=True)
 
+
+# Lazy-import helpers: resolved once per process, without paying the heavy
+# module imports at orchestrator import time (keeps the holiday fast path cheap)
+@functools.cache
+def _get_markdown_to_pdf():
+    from pdf_converter import markdown_to_pdf
+    return markdown_to_pdf
+
+
+@functools.cache
+def _get_summary_generator_cls():
+    from telegram_summary_agent import TelegramSummaryGenerator
+    return TelegramSummaryGenerator
+
+
+@functools.cache
+def _get_bot_agent_cls():
+    from telegram_bot_agent import TelegramBotAgent
+    return TelegramBotAgent
+
+
+@functools.cache
+def _get_analyze_stock():
+    from cores.main import analyze_stock
+    return analyze_stock
+
+
+def _load_json_file(path):
+    """Parse a JSON file, preferring orjson when installed"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 class StockAnalysisOrchestrator:
     """Stock Analysis and Telegram Transmission Orchestrator"""
 
@@ -56,6 +118,29 @@ class StockAnalysisOrchestrator:
         self.selected_tickers = {}  # Store selected stock information
         self.telegram_config = telegram_config or TelegramConfig(use_telegram=True)
 
+        # Process pool for PDF conversion (each conversion forks its own browser)
+        self._pdf_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+        # Shared telegram bot agent (reuses one HTTP connection pool per run)
+        self._bot_agent = None
+
+        # Limiters shared across pipelines - with --mode both the morning and
+        # afternoon pipelines run concurrently, so the analysis/summary/send
+        # bounds must hold process-wide instead of doubling per pipeline
+        self._analyze_concurrency = int(os.getenv("ANALYZE_CONCURRENCY", "3"))
+        self._analyze_sem = asyncio.Semaphore(self._analyze_concurrency)
+        self._summary_sem = asyncio.Semaphore(SUMMARY_CONCURRENCY)
+        self._pdf_send_limiter = AsyncLimiter(1, 1)
+
+        # The tracking batch mutates the shared portfolio DB (max-10-slot buy
+        # decisions) and enters the module-level MCPApp context, so only one
+        # batch may run at a time
+        self._tracking_lock = asyncio.Lock()
+
+        # Single date key for the whole run - keeps result/report file names
+        # consistent even when the run crosses midnight
+        self._run_date = datetime.now().strftime("%Y%m%d")
+
     @staticmethod
     def _extract_base64_images(markdown_text: str) -> tuple[str, dict]:
         """
@@ -148,6 +233,27 @@ class StockAnalysisOrchestrator:
         logger.info(f"Restored {len(images)} base64 images to translated text")
         return restored_text
 
+    def _get_bot(self):
+        """Return the shared TelegramBotAgent, creating it on first use"""
+        if self._bot_agent is None:
+            self._bot_agent = _get_bot_agent_cls()()
+        return self._bot_agent
+
+    async def close(self):
+        """Tear down the shared telegram HTTP session"""
+        if self._bot_agent is not None:
+            try:
+                await self._bot_agent.bot.shutdown()
+            except Exception as e:
+                logger.warning(f"Error closing telegram bot session: {str(e)}")
+            self._bot_agent = None
+
+    @staticmethod
+    async def _pump(stream, log):
+        """Relay subprocess output to the logger line by line"""
+        async for line in stream:
+            log(line.decode('utf-8', errors='replace').rstrip())
+
     async def run_trigger_batch(self, mode):
         """
         Execute trigger batch and save results (async version)
@@ -160,42 +266,23 @@ class StockAnalysisOrchestrator:
         """
         logger.info(f"Starting trigger batch execution: {mode}")
         try:
-            # Execute batch process
-            import subprocess
-
             # Save results to temporary file
-            results_file = f"trigger_results_{mode}_{datetime.now().strftime('%Y%m%d')}.json"
+            results_file = f"trigger_results_{mode}_{self._run_date}.json"
 
             # Execute command - run asynchronously using asyncio.create_subprocess_exec
-            import asyncio
             process = await asyncio.create_subprocess_exec(
                 sys.executable, "trigger_batch.py", mode, "INFO", "--output", results_file,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
 
-            stdout, stderr = await process.communicate()
-
-            # Log output - resolve encoding issues
-            if stdout:
-                try:
-                    stdout_text = stdout.decode('utf-8')
-                except UnicodeDecodeError:
-                    try:
-                        stdout_text = stdout.decode('cp949')  # Windows Korean encoding
-                    except UnicodeDecodeError:
-                        stdout_text = stdout.decode('utf-8', errors='ignore')
-                logger.info(f"Batch output:\n{stdout_text}")
+            # Stream output as it arrives instead of buffering it all in memory
+            stdout_task = asyncio.create_task(self._pump(process.stdout, logger.info))
+            stderr_task = asyncio.create_task(self._pump(process.stderr, logger.warning))
 
-            if stderr:
-                try:
-                    stderr_text = stderr.decode('utf-8')
-                except UnicodeDecodeError:
-                    try:
-                        stderr_text = stderr.decode('cp949')  # Windows Korean encoding
-                    except UnicodeDecodeError:
-                        stderr_text = stderr.decode('utf-8', errors='ignore')
-                logger.warning(f"Batch error:\n{stderr_text}")
+            await process.wait()
+            await stdout_task
+            await stderr_task
 
             if process.returncode != 0:
                 logger.error(f"Batch process failed: exit code {process.returncode}")
@@ -203,28 +290,26 @@ class StockAnalysisOrchestrator:
 
             # Read results file
             if os.path.exists(results_file):
-                with open(results_file, 'r', encoding='utf-8') as f:
-                    results = json.load(f)
+                results = _load_json_file(results_file)
 
                 # Save results
                 self.selected_tickers[mode] = results
 
-                # Extract stock codes - modified to match JSON structure
-                tickers = []
-                ticker_codes = set()  # For duplicate checking
+                # Extract stock codes - a dict keyed by code dedupes while
+                # preserving first-seen order
+                seen = {}
 
                 # Extract stocks by trigger type (excluding metadata)
                 for trigger_type, stocks in results.items():
-                    if trigger_type != "metadata" and isinstance(stocks, list):
-                        for stock in stocks:
-                            if isinstance(stock, dict) and 'code' in stock:
-                                code = stock['code']
-                                if code not in ticker_codes:  # Remove duplicates
-                                    ticker_codes.add(code)
-                                    tickers.append({
-                                        'code': code,
-                                        'name': stock.get('name', '')
-                                    })
+                    if trigger_type == "metadata" or not isinstance(stocks, list):
+                        continue
+                    for stock in stocks:
+                        if isinstance(stock, dict):
+                            code = stock.get('code')
+                            if code and code not in seen:
+                                seen[code] = {'code': code, 'name': stock.get('name', '')}
+
+                tickers = list(seen.values())
 
                 logger.info(f"Number of selected stocks: {len(tickers)}")
                 return tickers
@@ -247,71 +332,103 @@ class StockAnalysisOrchestrator:
             list: List of generated PDF file paths
         """
         logger.info(f"Starting PDF conversion for {len(report_paths)} reports")
-        pdf_paths = []
-
-        # Import PDF converter module
-        from pdf_converter import markdown_to_pdf
-
-        for report_path in report_paths:
-            try:
-                report_file = Path(report_path)
-                pdf_file = PDF_REPORTS_DIR / f"{report_file.stem}.pdf"
 
-                # Convert markdown to PDF
-                markdown_to_pdf(report_path, pdf_file, 'playwright', add_theme=True, enable_watermark=False)
+        # Resolve PDF converter once per process
+        markdown_to_pdf = _get_markdown_to_pdf()
+
+        # Dispatch conversions to the process pool - each one is an independent
+        # browser render, so they parallelize across cores
+        loop = asyncio.get_running_loop()
+        pdf_files = [PDF_REPORTS_DIR / f"{Path(p).stem}.pdf" for p in report_paths]
+        tasks = [
+            loop.run_in_executor(
+                self._pdf_pool,
+                functools.partial(markdown_to_pdf, str(report_path), str(pdf_file),
+                                  'playwright', add_theme=True, enable_watermark=False)
+            )
+            for report_path, pdf_file in zip(report_paths, pdf_files)
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
+        pdf_paths = []
+        for report_path, pdf_file, result in zip(report_paths, pdf_files, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error during PDF conversion of {report_path}: {str(result)}")
+            else:
                 logger.info(f"PDF conversion complete: {pdf_file}")
                 pdf_paths.append(pdf_file)
 
-            except Exception as e:
-                logger.error(f"Error during PDF conversion of {report_path}: {str(e)}")
-
         return pdf_paths
 
-    async def generate_telegram_messages(self, report_pdf_paths, language: str = "ko"):
+    @staticmethod
+    def _mode_msgs_dir(mode: str) -> Path:
+        """
+        Per-mode telegram message directory.
+
+        Keeps concurrent pipelines (--mode both) from sweeping each other's
+        files: process_messages_directory sends and moves everything in the
+        directory it is given, so each mode gets its own.
+        """
+        msgs_dir = TELEGRAM_MSGS_DIR / mode
+        msgs_dir.mkdir(parents=True, exist_ok=True)
+        (msgs_dir / "sent").mkdir(exist_ok=True)
+        return msgs_dir
+
+    async def generate_telegram_messages(self, report_pdf_paths, language: str = "ko", mode: str = ""):
         """
         Generate telegram messages
 
         Args:
             report_pdf_paths (list): List of report file (pdf) paths
             language (str): Message language ("ko" or "en")
+            mode (str): Execution mode - messages land in a per-mode directory
 
         Returns:
             list: List of generated telegram message file paths
         """
         logger.info(f"Starting telegram message generation for {len(report_pdf_paths)} reports (language: {language})")
 
-        # Import telegram summary generator module
-        from telegram_summary_agent import TelegramSummaryGenerator
+        msgs_dir = self._mode_msgs_dir(mode)
 
         # Initialize summary generator
-        generator = TelegramSummaryGenerator()
+        generator = _get_summary_generator_cls()()
 
-        message_paths = []
-        for report_pdf_path in report_pdf_paths:
-            try:
-                # Generate telegram message
-                await generator.process_report(str(report_pdf_path), str(TELEGRAM_MSGS_DIR), to_lang=language)
+        # Summaries are LLM-bound, so run a few concurrently while keeping
+        # the provider rate limit in check (shared across pipelines)
+        semaphore = self._summary_sem
 
-                # Estimate generated message file path
-                report_file = Path(report_pdf_path)
-                ticker = report_file.stem.split('_')[0]
-                company_name = report_file.stem.split('_')[1]
+        async def process_one(report_pdf_path):
+            async with semaphore:
+                try:
+                    await generator.process_report(str(report_pdf_path), str(msgs_dir), to_lang=language)
+                except Exception as e:
+                    logger.error(f"Error during telegram message generation for {report_pdf_path}: {str(e)}")
 
-                message_path = TELEGRAM_MSGS_DIR / f"{ticker}_{company_name}_telegram.txt"
+        await asyncio.gather(*(process_one(p) for p in report_pdf_paths))
 
-                if message_path.exists():
-                    logger.info(f"Telegram message generation complete: {message_path}")
-                    message_paths.append(message_path)
-                else:
-                    logger.warning(f"Telegram message file not found at expected path: {message_path}")
+        # Resolve generated message file paths - one directory scan instead
+        # of a stat syscall per expected file
+        present = {entry.name for entry in os.scandir(msgs_dir)}
 
-            except Exception as e:
-                logger.error(f"Error during telegram message generation for {report_pdf_path}: {str(e)}")
+        message_paths = []
+        for report_pdf_path in report_pdf_paths:
+            # Estimate generated message file path
+            report_file = Path(report_pdf_path)
+            ticker = report_file.stem.split('_')[0]
+            company_name = report_file.stem.split('_')[1]
+
+            message_name = f"{ticker}_{company_name}_telegram.txt"
+            message_path = msgs_dir / message_name
+
+            if message_name in present:
+                logger.info(f"Telegram message generation complete: {message_path}")
+                message_paths.append(message_path)
+            else:
+                logger.warning(f"Telegram message file not found at expected path: {message_path}")
 
         return message_paths
 
-    async def send_telegram_messages(self, message_paths, pdf_paths, report_paths=None):
+    async def send_telegram_messages(self, message_paths, pdf_paths, report_paths=None, mode: str = ""):
         """
         Send telegram messages and PDF files
 
@@ -319,6 +436,7 @@ class StockAnalysisOrchestrator:
             message_paths (list): List of telegram message file paths
             pdf_paths (list): List of PDF file paths
             report_paths (list): List of markdown report file paths (for translation)
+            mode (str): Execution mode - sweeps only that mode's message directory
         """
         # Skip if telegram is disabled
         if not self.telegram_config.use_telegram:
@@ -333,35 +451,43 @@ class StockAnalysisOrchestrator:
             logger.error("Telegram channel ID is not configured.")
             return
 
-        # Initialize telegram bot agent
-        from telegram_bot_agent import TelegramBotAgent
-
         try:
-            bot_agent = TelegramBotAgent()
+            # Reuse the shared telegram bot agent
+            bot_agent = self._get_bot()
 
             # Send translated messages to broadcast channels BEFORE process_messages_directory moves files
             if self.telegram_config.broadcast_languages:
                 await self._send_translated_messages(bot_agent, message_paths)
 
-            # Send messages to main channel (this moves files to sent folder)
+            # Send messages to main channel (this moves files to sent folder) -
+            # the sweep is scoped to this mode's directory, so it never picks
+            # up the other pipeline's freshly generated messages
+            msgs_dir = self._mode_msgs_dir(mode)
             await bot_agent.process_messages_directory(
-                str(TELEGRAM_MSGS_DIR),
+                str(msgs_dir),
                 chat_id,
-                str(TELEGRAM_MSGS_DIR / "sent")
+                str(msgs_dir / "sent")
             )
 
-            # Send PDF files to main channel
-            for pdf_path in pdf_paths:
-                logger.info(f"Sending PDF file: {pdf_path}")
-                success = await bot_agent.send_document(chat_id, str(pdf_path))
-                if success:
+            # Send PDF files to main channel - the shared token bucket paces
+            # the API calls at 1/s process-wide while letting uploads overlap,
+            # so there is no idle gap between one response and the next send
+            limiter = self._pdf_send_limiter
+
+            async def send_pdf(pdf_path):
+                async with limiter:
+                    logger.info(f"Sending PDF file: {pdf_path}")
+                    return await bot_agent.send_document(chat_id, str(pdf_path))
+
+            send_results = await asyncio.gather(
+                *(send_pdf(p) for p in pdf_paths), return_exceptions=True
+            )
+            for pdf_path, success in zip(pdf_paths, send_results):
+                if success is True:
                     logger.info(f"PDF file transmission successful: {pdf_path}")
                 else:
                     logger.error(f"PDF file transmission failed: {pdf_path}")
 
-                # Transmission interval
-                await asyncio.sleep(1)
-
             # Send translated PDFs to broadcast channels asynchronously (non-blocking)
             if self.telegram_config.broadcast_languages and report_paths:
                 asyncio.create_task(self._send_translated_pdfs(bot_agent, report_paths))
@@ -509,13 +635,14 @@ class StockAnalysisOrchestrator:
         except Exception as e:
             logger.error(f"Error in _send_translated_pdfs: {str(e)}")
 
-    async def send_trigger_alert(self, mode, trigger_results_file, language: str = "ko"):
+    async def send_trigger_alert(self, mode, trigger_results, language: str = "ko"):
         """
         Send trigger execution result information to telegram channel immediately
 
         Args:
             mode: 'morning' or 'afternoon'
-            trigger_results_file: Path to trigger results JSON file
+            trigger_results: Parsed trigger results dict, or a path to the
+                results JSON file (for standalone callers)
             language: Message language ("ko" or "en")
         """
         # Log and return if telegram is disabled
@@ -526,13 +653,15 @@ class StockAnalysisOrchestrator:
         logger.info(f"Starting Prism Signal alert transmission - mode: {mode}, language: {language}")
 
         try:
-            # Read JSON file
-            with open(trigger_results_file, 'r', encoding='utf-8') as f:
-                results = json.load(f)
+            # Reuse an already-parsed dict; only hit the file for path callers
+            if isinstance(trigger_results, dict):
+                results = trigger_results
+            else:
+                results = _load_json_file(trigger_results)
 
             # Extract metadata
             metadata = results.get("metadata", {})
-            trade_date = metadata.get("trade_date", datetime.now().strftime("%Y%m%d"))
+            trade_date = metadata.get("trade_date", self._run_date)
 
             # Extract trigger stock information - handle direct list case
             all_results = {}
@@ -564,11 +693,9 @@ class StockAnalysisOrchestrator:
                 logger.error("Telegram channel ID is not configured.")
                 return False
 
-            # Initialize telegram bot agent
-            from telegram_bot_agent import TelegramBotAgent
-
             try:
-                bot_agent = TelegramBotAgent()
+                # Reuse the shared telegram bot agent
+                bot_agent = self._get_bot()
 
                 # Send message to main channel
                 success = await bot_agent.send_message(chat_id, message)
@@ -651,76 +778,84 @@ class StockAnalysisOrchestrator:
             title = "🔔 오후 프리즘 시그널 얼럿"
             time_desc = "장 마감 후"
 
-        # Message header
-        message = f"{title}\n"
-        message += f"📅 {formatted_date} {time_desc} 포착된 관심종목\n\n"
+        # Build message chunks and join once at the end
+        parts = [f"{title}\n", f"📅 {formatted_date} {time_desc} 포착된 관심종목\n\n"]
 
         # Add stock information by trigger
         for trigger_type, stocks in results.items():
             # Set emoji based on trigger type
             emoji = self._get_trigger_emoji(trigger_type)
 
-            message += f"{emoji} *{trigger_type}*\n"
+            parts.append(f"{emoji} *{trigger_type}*\n")
+
+            # The trigger type is fixed for this batch of stocks - decide the
+            # extra-detail branch once instead of per stock
+            is_volume = trigger_type.startswith("거래량")
+            is_gap = trigger_type.startswith("갭 상승")
+            is_cap_ratio = "시총 대비" in trigger_type
+            is_closing = "마감 강도" in trigger_type
 
             # Add each stock information
             for stock in stocks:
-                code = stock.get("code", "")
-                name = stock.get("name", "")
-                current_price = stock.get("current_price", 0)
-                change_rate = stock.get("change_rate", 0)
+                code, name, current_price, change_rate = (
+                    stock.get("code", ""), stock.get("name", ""),
+                    stock.get("current_price", 0), stock.get("change_rate", 0)
+                )
 
                 # Arrow based on change rate
                 arrow = "⬆️" if change_rate > 0 else "⬇️" if change_rate < 0 else "➖"
 
                 # Basic information
-                message += f"· *{name}* ({code})\n"
-                message += f"  {current_price:,.0f}원 {arrow} {abs(change_rate):.2f}%\n"
+                parts.append(f"· *{name}* ({code})\n")
+                parts.append(f"  {current_price:,.0f}원 {arrow} {abs(change_rate):.2f}%\n")
 
                 # Additional information based on trigger type
-                if "volume_increase" in stock and trigger_type.startswith("거래량"):
+                if is_volume and "volume_increase" in stock:
                     volume_increase = stock.get("volume_increase", 0)
-                    message += f"  거래량 증가율: {volume_increase:.2f}%\n"
+                    parts.append(f"  거래량 증가율: {volume_increase:.2f}%\n")
 
-                elif "gap_rate" in stock and trigger_type.startswith("갭 상승"):
+                elif is_gap and "gap_rate" in stock:
                     gap_rate = stock.get("gap_rate", 0)
-                    message += f"  갭 상승률: {gap_rate:.2f}%\n"
+                    parts.append(f"  갭 상승률: {gap_rate:.2f}%\n")
 
-                elif "trade_value_ratio" in stock and "시총 대비" in trigger_type:
+                elif is_cap_ratio and "trade_value_ratio" in stock:
                     trade_value_ratio = stock.get("trade_value_ratio", 0)
                     market_cap = stock.get("market_cap", 0) / 100000000  # Convert to hundred million won units
-                    message += f"  거래대금/시총 비율: {trade_value_ratio:.2f}%\n"
-                    message += f"  시가총액: {market_cap:.2f}억원\n"
+                    parts.append(f"  거래대금/시총 비율: {trade_value_ratio:.2f}%\n")
+                    parts.append(f"  시가총액: {market_cap:.2f}억원\n")
 
-                elif "closing_strength" in stock and "마감 강도" in trigger_type:
+                elif is_closing and "closing_strength" in stock:
                     closing_strength = stock.get("closing_strength", 0) * 100
-                    message += f"  마감 강도: {closing_strength:.2f}%\n"
+                    parts.append(f"  마감 강도: {closing_strength:.2f}%\n")
 
-                message += "\n"
+                parts.append("\n")
 
         # Footer message
-        message += "💡 상세 분석 보고서는 약 10-30분 내 제공 예정\n"
-        message += "⚠️ 본 정보는 투자 참고용이며, 투자 결정과 책임은 투자자에게 있습니다."
-
-        return message
-
-    def _get_trigger_emoji(self, trigger_type):
-        """
-        Return emoji matching trigger type
-        """
-        if "거래량" in trigger_type:
-            return "📊"
-        elif "갭 상승" in trigger_type:
-            return "📈"
-        elif "시총 대비" in trigger_type:
-            return "💰"
-        elif "상승률" in trigger_type:
-            return "🚀"
-        elif "마감 강도" in trigger_type:
-            return "🔨"
-        elif "횡보" in trigger_type:
-            return "↔️"
-        else:
-            return "🔎"
+        parts.append("💡 상세 분석 보고서는 약 10-30분 내 제공 예정\n")
+        parts.append("⚠️ 본 정보는 투자 참고용이며, 투자 결정과 책임은 투자자에게 있습니다.")
+
+        return ''.join(parts)
+
+    # Keyword → emoji rules, scanned in order
+    _EMOJI_RULES = (
+        ("거래량", "📊"),
+        ("갭 상승", "📈"),
+        ("시총 대비", "💰"),
+        ("상승률", "🚀"),
+        ("마감 강도", "🔨"),
+        ("횡보", "↔️"),
+    )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _get_trigger_emoji(trigger_type):
+        """
+        Return emoji matching trigger type (cached - trigger types repeat)
+        """
+        for keyword, emoji in StockAnalysisOrchestrator._EMOJI_RULES:
+            if keyword in trigger_type:
+                return emoji
+        return "🔎"
 
     async def run_full_pipeline(self, mode, language: str = "ko"):
         """
@@ -734,23 +869,23 @@ class StockAnalysisOrchestrator:
 
         try:
             # 1. Execute trigger batch - changed to async method (improved asyncio resource management)
-            results_file = f"trigger_results_{mode}_{datetime.now().strftime('%Y%m%d')}.json"
             tickers = await self.run_trigger_batch(mode)
 
             if not tickers:
                 logger.warning("No stocks selected. Terminating process.")
                 return
 
-            # 1-1. Send trigger results to telegram immediately
-            if os.path.exists(results_file):
-                logger.info(f"Trigger results file confirmed: {results_file}")
-                alert_sent = await self.send_trigger_alert(mode, results_file, language)
+            # 1-1. Send trigger results to telegram immediately - reuse the
+            # dict run_trigger_batch already parsed instead of re-reading the file
+            trigger_results = self.selected_tickers.get(mode)
+            if trigger_results:
+                alert_sent = await self.send_trigger_alert(mode, trigger_results, language)
                 if alert_sent:
                     logger.info("Prism Signal alert transmission complete")
                 else:
                     logger.warning("Prism Signal alert transmission failed")
             else:
-                logger.warning(f"Trigger results file not found: {results_file}")
+                logger.warning(f"No trigger results available for mode: {mode}")
 
             # 2. Generate reports - important: await added here!
             report_paths = await self.generate_reports(tickers, mode, timeout=600, language=language)
@@ -766,55 +901,57 @@ class StockAnalysisOrchestrator:
                 logger.info("Telegram enabled - proceeding with message generation and transmission steps")
 
                 # 4. Generate telegram messages
-                message_paths = await self.generate_telegram_messages(pdf_paths, language)
+                message_paths = await self.generate_telegram_messages(pdf_paths, language, mode)
 
                 # 5. Send telegram messages and PDFs
-                await self.send_telegram_messages(message_paths, pdf_paths, report_paths)
+                await self.send_telegram_messages(message_paths, pdf_paths, report_paths, mode)
             else:
                 logger.info("Telegram disabled - skipping message generation and transmission steps")
 
-            # 6. Tracking system batch
+            # 6. Tracking system batch - serialized across pipelines: the
+            # batch trades against one shared portfolio DB, so two concurrent
+            # runs could double-fill the 10 slots
             if pdf_paths:
-                try:
-                    logger.info("Starting stock tracking system batch execution")
-
-                    # Import tracking agent
-                    from stock_tracking_enhanced_agent import EnhancedStockTrackingAgent as StockTrackingAgent
-                    from stock_tracking_agent import app as tracking_app
-
-                    # Validate telegram configuration
-                    if self.telegram_config.use_telegram:
-                        # Validate required settings when telegram is enabled
-                        try:
-                            self.telegram_config.validate_or_raise()
-                        except ValueError as ve:
-                            logger.error(f"Telegram configuration error: {str(ve)}")
-                            logger.error("Skipping tracking system batch.")
-                            return
-
-                    # Log telegram configuration status
-                    self.telegram_config.log_status()
-
-                    # Use MCPApp context manager
-                    async with tracking_app.run():
-                        # Pass telegram configuration to agent
-                        tracking_agent = StockTrackingAgent(
-                            telegram_token=self.telegram_config.bot_token if self.telegram_config.use_telegram else None
-                        )
+                async with self._tracking_lock:
+                    try:
+                        logger.info("Starting stock tracking system batch execution")
+
+                        # Import tracking agent
+                        from stock_tracking_enhanced_agent import EnhancedStockTrackingAgent as StockTrackingAgent
+                        from stock_tracking_agent import app as tracking_app
+
+                        # Validate telegram configuration
+                        if self.telegram_config.use_telegram:
+                            # Validate required settings when telegram is enabled
+                            try:
+                                self.telegram_config.validate_or_raise()
+                            except ValueError as ve:
+                                logger.error(f"Telegram configuration error: {str(ve)}")
+                                logger.error("Skipping tracking system batch.")
+                                return
+
+                        # Log telegram configuration status
+                        self.telegram_config.log_status()
+
+                        # Use MCPApp context manager
+                        async with tracking_app.run():
+                            # Pass telegram configuration to agent
+                            tracking_agent = StockTrackingAgent(
+                                telegram_token=self.telegram_config.bot_token if self.telegram_config.use_telegram else None
+                            )
 
-                        # Pass report paths, telegram configuration, and language
-                        chat_id = self.telegram_config.channel_id if self.telegram_config.use_telegram else None
-                        tracking_success = await tracking_agent.run(pdf_paths, chat_id, language, self.telegram_config)
+                            # Pass report paths, telegram configuration, and language
+                            chat_id = self.telegram_config.channel_id if self.telegram_config.use_telegram else None
+                            tracking_success = await tracking_agent.run(pdf_paths, chat_id, language, self.telegram_config)
 
-                        if tracking_success:
-                            logger.info("Tracking system batch execution complete")
-                        else:
-                            logger.error("Tracking system batch execution failed")
+                            if tracking_success:
+                                logger.info("Tracking system batch execution complete")
+                            else:
+                                logger.error("Tracking system batch execution failed")
 
-                except Exception as e:
-                    logger.error(f"Error during tracking system batch execution: {str(e)}")
-                    import traceback
-                    logger.error(traceback.format_exc())
+                    except Exception as e:
+                        logger.error(f"Error during tracking system batch execution: {str(e)}")
+                        logger.error(traceback.format_exc())
             else:
                 logger.warning("No reports generated, not executing tracking system batch.")
 
@@ -822,30 +959,28 @@ class StockAnalysisOrchestrator:
 
         except Exception as e:
             logger.error(f"Error during pipeline execution: {str(e)}")
-            import traceback
             logger.error(traceback.format_exc())
 
     async def generate_reports(self, tickers, mode, timeout: int = None, language: str = "ko") -> list:
         """
-        Generate reports serially for all stocks.
-        Process one stock at a time to prevent OpenAI rate limit issues.
+        Generate reports for all stocks with bounded concurrency.
+        The limit (ANALYZE_CONCURRENCY, default 3) keeps us inside the
+        OpenAI rate limit budget while overlapping network-bound analyses.
 
         Args:
             tickers: List of stocks to analyze
             mode: Execution mode
-            timeout: Timeout (seconds)
+            timeout: Timeout per stock (seconds)
             language: Analysis language ("ko" or "en")
 
         Returns:
             list: List of successful report paths
         """
+        semaphore = self._analyze_sem
 
-        logger.info(f"Starting report generation for {len(tickers)} stocks (serial processing)")
-
-        successful_reports = []
+        logger.info(f"Starting report generation for {len(tickers)} stocks (concurrency: {self._analyze_concurrency})")
 
-        # Process each stock sequentially
-        for idx, ticker_info in enumerate(tickers, 1):
+        async def analyze_one(idx, ticker_info):
             # If ticker_info is a dict
             if isinstance(ticker_info, dict):
                 ticker = ticker_info.get('code')
@@ -854,39 +989,48 @@ class StockAnalysisOrchestrator:
                 ticker = ticker_info
                 company_name = f"Stock_{ticker}"
 
-            logger.info(f"[{idx}/{len(tickers)}] Starting stock analysis: {company_name}({ticker})")
-
-            # Set output file path
-            reference_date = datetime.now().strftime("%Y%m%d")
+            # Set output file path - shared run date matches the trigger results file
+            reference_date = self._run_date
             output_file = str(REPORTS_DIR / f"{ticker}_{company_name}_{reference_date}_{mode}_gpt4.1.md")
 
-            try:
-                # Import function directly from main.py
-                from cores.main import analyze_stock
-
-                # Use await directly since already in async environment
-                logger.info(f"[{idx}/{len(tickers)}] Starting analyze_stock function call")
-                report = await analyze_stock(
-                    company_code=ticker,
-                    company_name=company_name,
-                    reference_date=reference_date,
-                    language=language
-                )
+            async with semaphore:
+                logger.info(f"[{idx}/{len(tickers)}] Starting stock analysis: {company_name}({ticker})")
+                try:
+                    # Resolve analysis entry point once per process
+                    analyze_stock = _get_analyze_stock()
+
+                    coro = analyze_stock(
+                        company_code=ticker,
+                        company_name=company_name,
+                        reference_date=reference_date,
+                        language=language
+                    )
+                    report = await (asyncio.wait_for(coro, timeout) if timeout else coro)
+
+                    # Save result - write off-loop so concurrent analyses
+                    # never stall on disk I/O
+                    if report and len(report.strip()) > 0:
+                        await asyncio.to_thread(
+                            Path(output_file).write_text, report, encoding="utf-8"
+                        )
+                        logger.info(f"[{idx}/{len(tickers)}] Report generation complete: {company_name}({ticker}) - {len(report)} characters")
+                        return output_file
 
-                # Save result
-                if report and len(report.strip()) > 0:
-                    with open(output_file, "w", encoding="utf-8") as f:
-                        f.write(report)
-                    logger.info(f"[{idx}/{len(tickers)}] Report generation complete: {company_name}({ticker}) - {len(report)} characters")
-                    successful_reports.append(output_file)
-                else:
                     logger.error(f"[{idx}/{len(tickers)}] Report generation failed: {company_name}({ticker}) - empty content")
 
-            except Exception as e:
-                logger.error(f"[{idx}/{len(tickers)}] Error during analysis: {company_name}({ticker}) - {str(e)}")
-                import traceback
-                logger.error(traceback.format_exc())
+                except Exception as e:
+                    logger.error(f"[{idx}/{len(tickers)}] Error during analysis: {company_name}({ticker}) - {str(e)}")
+                    logger.error(traceback.format_exc())
+
+                return None
 
+        results = await asyncio.gather(
+            *(analyze_one(idx, ticker_info) for idx, ticker_info in enumerate(tickers, 1)),
+            return_exceptions=True
+        )
+
+        # Keep input ordering; drop failures and unexpected exceptions
+        successful_reports = [r for r in results if isinstance(r, str)]
 
         logger.info(f"Report generation complete: {len(successful_reports)}/{len(tickers)} successful")
 
@@ -896,6 +1040,8 @@ async def main():
     """
     Main function - command line interface
     """
+    _configure_logging()
+
     parser = argparse.ArgumentParser(description="Stock analysis and telegram transmission orchestrator")
     parser.add_argument("--mode", choices=["morning", "afternoon", "both"], default="both",
                         help="Execution mode (morning, afternoon, both)")
@@ -930,35 +1076,41 @@ async def main():
 
     orchestrator = StockAnalysisOrchestrator(telegram_config=telegram_config)
 
+    # Morning and afternoon pipelines touch disjoint data (per-mode result
+    # files, tickers and telegram message directories), so --mode both runs
+    # them concurrently; the orchestrator's instance-level limiters and
+    # tracking lock keep the shared bounds (analysis/summary/send rates,
+    # portfolio DB) intact
+    pipelines = []
     if args.mode == "morning" or args.mode == "both":
-        await orchestrator.run_full_pipeline("morning", language=args.language)
+        pipelines.append(orchestrator.run_full_pipeline("morning", language=args.language))
 
     if args.mode == "afternoon" or args.mode == "both":
-        await orchestrator.run_full_pipeline("afternoon", language=args.language)
+        pipelines.append(orchestrator.run_full_pipeline("afternoon", language=args.language))
+
+    try:
+        await asyncio.gather(*pipelines)
+    finally:
+        await orchestrator.close()
 
 if __name__ == "__main__":
-    # Check market holiday
+    # Check market holiday first - before the pipeline's heavy modules are
+    # pulled in and before any orchestrator log file is created, so holiday
+    # runs exit almost instantly and leave no stray files
     from check_market_day import is_market_day
 
     if not is_market_day():
         current_date = datetime.now().date()  # Use datetime.now()
-        logger.info(f"Today ({current_date}) is a stock market holiday. Not executing batch job.")
+        print(f"Today ({current_date}) is a stock market holiday. Not executing batch job.")
         sys.exit(0)
 
-    # Start timer thread and execute main function only on business days
-    import threading
-
-    # Timer function to terminate process after 120 minutes
-    def exit_after_timeout():
-        import time
-        import os
-        import signal
-        time.sleep(7200)  # Wait 120 minutes
-        logger.warning("120-minute timeout reached: forcefully terminating process")
-        os.kill(os.getpid(), signal.SIGTERM)
-
-    # Start timer as background thread
-    timer_thread = threading.Thread(target=exit_after_timeout, daemon=True)
-    timer_thread.start()
+    _configure_logging()
 
-    asyncio.run(main())
\ No newline at end of file
+    # Execute main function only on business days, bounded by a 120-minute
+    # deadline - on timeout, cancellation propagates through the pipeline
+    # awaits so subprocesses and sessions get cleaned up properly
+    try:
+        asyncio.run(asyncio.wait_for(main(), timeout=7200))
+    except asyncio.TimeoutError:
+        logger.warning("120-minute timeout reached: terminating pipeline")
+        sys.exit(1)
\ No newline at end of file
@@ -5,12 +5,23 @@ Telegram configuration and utility module
 Encapsulates telegram usage settings following SOLID principles
 and minimizes redundant conditional processing.
 """
+import functools
 import logging
 import os
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# .env only needs to be parsed once per process, however many
+# TelegramConfig instances subsystems create
+_DOTENV_LOADED = False
+
+
+@functools.cache
+def _get_lang_channel(lang: str) -> Optional[str]:
+    """Resolve the broadcast channel ID env var for a language (cached)"""
+    return os.getenv(f"TELEGRAM_CHANNEL_ID_{lang.upper()}")
+
 
 class TelegramConfig:
     """
@@ -50,11 +61,16 @@ class TelegramConfig:
     
     def _load_env(self):
         """
-        Load environment variables from .env file
+        Load environment variables from .env file (once per process)
         """
+        global _DOTENV_LOADED
+        if _DOTENV_LOADED:
+            return
+
         try:
             from dotenv import load_dotenv
             load_dotenv()
+            _DOTENV_LOADED = True
             logger.debug(".env file loaded successfully")
         except ImportError:
             logger.warning("python-dotenv is not installed. Please set environment variables manually.")
@@ -67,9 +83,8 @@ class TelegramConfig:
         Loads from .env file in TELEGRAM_CHANNEL_ID_{LANG} format
         """
         for lang in self._broadcast_languages:
-            lang_upper = lang.upper()
-            env_key = f"TELEGRAM_CHANNEL_ID_{lang_upper}"
-            channel_id = os.getenv(env_key)
+            env_key = f"TELEGRAM_CHANNEL_ID_{lang.upper()}"
+            channel_id = _get_lang_channel(lang)
 
             if channel_id:
                 self._broadcast_channel_ids[lang] = channel_id
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+배치 번역 응답 파싱 테스트
+
+telegram_translator_agent.py의 _parse_multi_translation_response 로직을
+다양한 LLM 응답 형태에서 검증합니다:
+- 정상 strict JSON
+- 마크다운 코드 펜스로 감싼 JSON
+- json_repair로 복구 가능한 문법 오류 JSON
+- 일부 언어가 누락된 응답 (per-language 폴백 트리거)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+try:
+    from cores.agents.telegram_translator_agent import _parse_multi_translation_response
+except ImportError:
+    _parse_multi_translation_response = None
+
+# mcp-agent가 없는 환경에서는 모듈 임포트가 불가능하므로 전체 스킵
+pytestmark = pytest.mark.skipif(
+    _parse_multi_translation_response is None,
+    reason="mcp-agent is not installed"
+)
+
+
+class TestMultiTranslationParsing:
+    """_parse_multi_translation_response 테스트 클래스"""
+
+    def test_clean_json(self):
+        """정상적인 strict JSON 응답 파싱"""
+        response = '{"en": "Hello", "ja": "こんにちは"}'
+
+        result = _parse_multi_translation_response(response, ["en", "ja"])
+
+        assert result == {"en": "Hello", "ja": "こんにちは"}
+
+    def test_fenced_json(self):
+        """마크다운 코드 펜스(```json)로 감싼 응답 파싱"""
+        response = '```json\n{"en": "Hello", "ja": "こんにちは"}\n```'
+
+        result = _parse_multi_translation_response(response, ["en", "ja"])
+
+        assert result == {"en": "Hello", "ja": "こんにちは"}
+
+    def test_fenced_json_without_language_tag(self):
+        """언어 태그 없는 코드 펜스(```)로 감싼 응답 파싱"""
+        response = '```\n{"en": "Hello"}\n```'
+
+        result = _parse_multi_translation_response(response, ["en"])
+
+        assert result == {"en": "Hello"}
+
+    def test_repairable_json(self):
+        """json_repair로 복구 가능한 문법 오류 (마지막 쉼표)"""
+        pytest.importorskip("json_repair")
+        response = '{"en": "Hello", "ja": "こんにちは",}'
+
+        result = _parse_multi_translation_response(response, ["en", "ja"])
+
+        assert result == {"en": "Hello", "ja": "こんにちは"}
+
+    def test_missing_language_triggers_fallback(self):
+        """응답에 언어가 누락되면 결과에서도 빠져 폴백 대상이 됨"""
+        response = '{"en": "Hello"}'
+        to_langs = ["en", "ja", "zh"]
+
+        result = _parse_multi_translation_response(response, to_langs)
+
+        assert result == {"en": "Hello"}
+        # translate_telegram_message_multi가 폴백 대상을 고르는 방식 그대로
+        missing = [lang for lang in to_langs if lang not in result]
+        assert missing == ["ja", "zh"]
+
+    def test_empty_or_non_string_values_ignored(self):
+        """빈 문자열/비문자열 값은 유효한 번역으로 취급하지 않음"""
+        response = '{"en": "Hello", "ja": "", "zh": 123}'
+
+        result = _parse_multi_translation_response(response, ["en", "ja", "zh"])
+
+        assert result == {"en": "Hello"}
+
+    def test_unparseable_response_raises(self):
+        """JSON으로 복구 불가능한 응답은 예외 발생 (폴백 경로 진입)"""
+        with pytest.raises(Exception):
+            _parse_multi_translation_response("", ["en"])
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -6,49 +6,153 @@ Portfolio Telegram Reporter
 """
 
 import asyncio
+import atexit
+import hashlib
+import io
 import os
+import queue
+import re
 import sys
 import logging
 import datetime
+import time
 import yaml
+from functools import cache, lru_cache
+from operator import itemgetter
+from logging.handlers import QueueHandler, QueueListener
+
+try:
+    import uvloop  # Faster event loop for the HTTP fan-out workload
+    uvloop.install()
+except ImportError:  # pragma: no cover - optional dependency
+    pass
 from pathlib import Path
 from typing import Dict, Any, List
+from aiolimiter import AsyncLimiter
 from dotenv import load_dotenv
 
 # Set paths based on current script directory
-SCRIPT_DIR = Path(__file__).parent
+SCRIPT_DIR = Path(__file__).parent.absolute()  # trading/
 TRADING_DIR = SCRIPT_DIR
+PROJECT_ROOT = SCRIPT_DIR.parent              # project_root/
+CORES_PATH = PROJECT_ROOT / "cores"
+
+# Add paths for importing trading / cores modules (once, at process start)
+for _path in (PROJECT_ROOT, TRADING_DIR, CORES_PATH):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
 
-# Add paths for importing trading module
-PARENT_DIR = SCRIPT_DIR.parent
-sys.path.insert(0, str(PARENT_DIR))
-sys.path.insert(0, str(TRADING_DIR))
+# Load configuration file - prefer the libyaml C binding, which parses
+# noticeably faster and avoids the FullLoader security warning
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
-# Load configuration file
 CONFIG_FILE = TRADING_DIR / "config" / "kis_devlp.yaml"
-with open(CONFIG_FILE, encoding="UTF-8") as f:
-    _cfg = yaml.load(f, Loader=yaml.FullLoader)
+
+
+@cache
+def _load_cfg() -> dict:
+    """Parse kis_devlp.yaml once per process, however often it is requested"""
+    with open(CONFIG_FILE, encoding="UTF-8") as f:
+        return yaml.load(f, Loader=SafeLoader)
 
 # Import local modules
 from trading.domestic_stock_trading import DomesticStockTrading
 from telegram_bot_agent import TelegramBotAgent
-
-# Logging configuration
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(SCRIPT_DIR / 'portfolio_reporter.log'),
-        logging.StreamHandler()
-    ]
+from agents.telegram_translator_agent import translate_telegram_message_multi
+
+# Logging configuration - the file/stream handlers run on a background
+# QueueListener thread, so log calls from the event loop are cheap enqueues
+# instead of synchronous disk writes
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler(SCRIPT_DIR / 'portfolio_reporter.log')
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue(-1)
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
+
+_log_listener = QueueListener(
+    _log_queue, _file_handler, _stream_handler, respect_handler_level=True
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
 # Load .env file
-SCRIPT_DIR = Path(__file__).parent.absolute()  # trading/
-PROJECT_ROOT = SCRIPT_DIR.parent              # project_root/
 ENV_FILE = PROJECT_ROOT / ".env"
-load_dotenv(dotenv_path=str(ENV_FILE))
+
+
+@cache
+def _load_env() -> None:
+    """Load the project .env once per process (idempotent across re-imports)"""
+    load_dotenv(dotenv_path=str(ENV_FILE))
+
+
+_load_env()
+
+# On-disk cache for translated reports - reruns with an unchanged portfolio
+# skip the LLM round-trip entirely
+TRANSLATION_CACHE_DIR = SCRIPT_DIR / ".translation_cache"
+TRANSLATION_CACHE_TTL_SEC = 86400  # 24h
+
+# The report timestamp line changes every minute - it is normalized out of
+# the cache key and the current time is re-injected into cached translations,
+# so identical portfolios hash identically across runs
+_REPORT_TIME_RE = re.compile(r"🕐 \d{2}/\d{2} \d{2}:\d{2}")
+_REPORT_TIME_PLACEHOLDER = "🕐 00/00 00:00"
+
+# Per-stock fields used when formatting the portfolio - unpacked in one
+# itemgetter call instead of eight dict.get() lookups per holding
+_STOCK_DEFAULTS = {
+    'stock_name': '알 수 없음',
+    'stock_code': '',
+    'quantity': 0,
+    'current_price': 0,
+    'profit_amount': 0,
+    'profit_rate': 0,
+    'eval_amount': 0,
+    'avg_price': 0,
+}
+_STOCK_FIELDS = itemgetter(
+    'stock_name', 'stock_code', 'quantity', 'current_price',
+    'profit_amount', 'profit_rate', 'eval_amount', 'avg_price'
+)
+
+
+@lru_cache(maxsize=1024)
+def _fmt_currency(amount: float) -> str:
+    """Format amount in Korean Won (memoized - repeat values, notably 0, are O(1))"""
+    return f"{amount:,.0f}원" if amount else "0원"
+
+
+@lru_cache(maxsize=1024)
+def _fmt_percentage(rate: float) -> str:
+    """Format percentage (memoized)"""
+    return f"{rate:+.2f}%" if rate else "0.00%"
+
+
+# Static message templates - the fixed emoji/header/label text is built
+# once at import and only dynamic fields are injected per report, so
+# identical portfolios produce identical messages apart from the timestamp
+# line (which the translation cache normalizes out of its keys)
+_HEADER_TPL = (
+    "📊 포트폴리오 리포트 {mode_emoji}\n"
+    "🕐 {time} | {mode_text}\n\n"
+    "🏆 *시즌2* (시작일: {season_start})\n"
+    "💵 시작금액: `{season_amount}`\n\n"
+)
+_STOCK_TPL = (
+    "\n*{i}. {name}* ({code}) {emoji}\n"
+    "  평가금액: `{eval_amount}`\n"
+    "  평균단가: `{avg_price}` ({quantity}주)\n"
+    "  손익: `{profit_sign}{profit_amount}`  |  {profit_rate}\n"
+)
+
 
 class PortfolioTelegramReporter:
     """Class for reporting portfolio status to Telegram"""
@@ -57,6 +161,14 @@ class PortfolioTelegramReporter:
     SEASON2_START_DATE = "2025.09.29"
     SEASON2_START_AMOUNT = 9_969_801  # Starting capital in KRW
 
+    # Status message titles by status type
+    _STATUS_TITLES = {
+        "morning": "🌅 **장 시작 전 체크**",
+        "evening": "🌆 **장 마감 후 정리**",
+        "market_close": "🔔 **시장 마감**",
+        "weekend": "🏖️ **주말 상태 체크**"
+    }
+
     def __init__(self, telegram_token: str = None, chat_id: str = None, trading_mode: str = None, broadcast_languages: list = None):
         """
         Initialize
@@ -83,11 +195,24 @@ class PortfolioTelegramReporter:
         self._load_broadcast_channels()
 
         # Trading configuration - use yaml default_mode as default value
-        self.trading_mode = trading_mode if trading_mode is not None else _cfg["default_mode"]
+        self.trading_mode = trading_mode if trading_mode is not None else _load_cfg()["default_mode"]
         self.telegram_bot = TelegramBotAgent(token=self.telegram_token)
 
+        # Mode decorations never change after init - compute them once
+        self.mode_emoji = "🧪" if self.trading_mode == "demo" else "💰"
+        self.mode_text = "모의투자" if self.trading_mode == "demo" else "실전투자"
+
+        # Shared KIS trading client, created lazily - reusing it amortizes
+        # auth/token setup across report and status calls
+        self._trader = None
+
+        # Token bucket pacing telegram sends at 20 msg/s, safely below the
+        # ~30 msg/s API limit, so the broadcast fan-out never triggers 429
+        # retry backoff
+        self._tg_limiter = AsyncLimiter(20, 1)
+
         logger.info(f"PortfolioTelegramReporter initialized")
-        logger.info(f"Trading mode: {self.trading_mode} (yaml config: {_cfg['default_mode']})")
+        logger.info(f"Trading mode: {self.trading_mode} (yaml config: {_load_cfg()['default_mode']})")
 
     def _load_broadcast_channels(self):
         """
@@ -106,11 +231,11 @@ class PortfolioTelegramReporter:
 
     def format_currency(self, amount: float) -> str:
         """Format amount in Korean Won"""
-        return f"{amount:,.0f}원" if amount else "0원"
+        return _fmt_currency(amount)
 
     def format_percentage(self, rate: float) -> str:
         """Format percentage"""
-        return f"{rate:+.2f}%" if rate else "0.00%"
+        return _fmt_percentage(rate)
 
     def create_portfolio_message(self, portfolio: List[Dict[str, Any]], account_summary: Dict[str, Any]) -> str:
         """
@@ -124,16 +249,17 @@ class PortfolioTelegramReporter:
             Formatted telegram message
         """
         current_time = datetime.datetime.now().strftime("%m/%d %H:%M")
-        mode_emoji = "🧪" if self.trading_mode == "demo" else "💰"
-        mode_text = "모의투자" if self.trading_mode == "demo" else "실전투자"
-
-        # Header
-        message = f"📊 포트폴리오 리포트 {mode_emoji}\n"
-        message += f"🕐 {current_time} | {mode_text}\n\n"
 
-        # Season 2 info
-        message += f"🏆 *시즌2* (시작일: {self.SEASON2_START_DATE})\n"
-        message += f"💵 시작금액: `{self.format_currency(self.SEASON2_START_AMOUNT)}`\n\n"
+        # Stream the message into a single StringIO buffer instead of
+        # accumulating intermediate string objects
+        buf = io.StringIO()
+        buf.write(_HEADER_TPL.format_map({
+            'mode_emoji': self.mode_emoji,
+            'time': current_time,
+            'mode_text': self.mode_text,
+            'season_start': self.SEASON2_START_DATE,
+            'season_amount': self.format_currency(self.SEASON2_START_AMOUNT),
+        }))
 
         # Account summary
         if account_summary:
@@ -158,36 +284,31 @@ class PortfolioTelegramReporter:
             season_profit_emoji = "📈" if season_profit >= 0 else "📉"
             season_profit_sign = "+" if season_profit >= 0 else ""
 
-            message += f"💰 *총 자산*: `{self.format_currency(total_assets)}`\n"
-            message += f"{season_profit_emoji} 시즌 수익: `{season_profit_sign}{self.format_currency(season_profit)}` "
-            message += f"({self.format_percentage(season_profit_rate)})\n\n"
+            buf.write(f"💰 *총 자산*: `{self.format_currency(total_assets)}`\n")
+            buf.write(f"{season_profit_emoji} 시즌 수익: `{season_profit_sign}{self.format_currency(season_profit)}` ")
+            buf.write(f"({self.format_percentage(season_profit_rate)})\n\n")
 
             # Holdings profit (separate from season profit)
             holdings_profit_emoji = "📈" if total_profit >= 0 else "📉"
             holdings_profit_sign = "+" if total_profit >= 0 else ""
 
-            message += f"📊 *보유종목 평가손익*: `{holdings_profit_sign}{self.format_currency(total_profit)}` "
-            message += f"({self.format_percentage(total_profit_rate)})\n"
+            buf.write(f"📊 *보유종목 평가손익*: `{holdings_profit_sign}{self.format_currency(total_profit)}` ")
+            buf.write(f"({self.format_percentage(total_profit_rate)})\n")
 
             # Cash info (deposit = 예수금, available = 주문가능금액)
-            message += f"💳 현금(예수금): `{self.format_currency(deposit)}` (현금비율: {cash_ratio:.1f}%)\n"
-            message += "\n"
+            buf.write(f"💳 현금(예수금): `{self.format_currency(deposit)}` (현금비율: {cash_ratio:.1f}%)\n")
+            buf.write("\n")
         else:
-            message += "❌ 계좌 정보를 가져올 수 없습니다\n\n"
+            buf.write("❌ 계좌 정보를 가져올 수 없습니다\n\n")
 
         # 보유 종목
         if portfolio:
-            message += f"📈 보유종목 ({len(portfolio)}개)\n"
+            buf.write(f"📈 보유종목 ({len(portfolio)}개)\n")
 
             for i, stock in enumerate(portfolio, 1):
-                stock_name = stock.get('stock_name', '알 수 없음')
-                stock_code = stock.get('stock_code', '')
-                quantity = stock.get('quantity', 0)
-                current_price = stock.get('current_price', 0)
-                profit_amount = stock.get('profit_amount', 0)
-                profit_rate = stock.get('profit_rate', 0)
-                eval_amount = stock.get('eval_amount', 0)
-                avg_price = stock.get('avg_price', 0)
+                (stock_name, stock_code, quantity, current_price,
+                 profit_amount, profit_rate, eval_amount, avg_price) = \
+                    _STOCK_FIELDS({**_STOCK_DEFAULTS, **stock})
 
                 # 수익률 상태
                 if profit_rate > 0:
@@ -200,17 +321,55 @@ class PortfolioTelegramReporter:
                 profit_sign = "+" if profit_amount >= 0 else ""
 
                 # Stock information
-                message += f"\n*{i}. {stock_name}* ({stock_code}) {status_emoji}\n"
-                message += f"  평가금액: `{self.format_currency(eval_amount)}`\n"
-                message += f"  평균단가: `{self.format_currency(avg_price)}` ({quantity}주)\n"
-                message += f"  손익: `{profit_sign}{self.format_currency(profit_amount)}`  |  {self.format_percentage(profit_rate)}\n"
+                buf.write(_STOCK_TPL.format_map({
+                    'i': i,
+                    'name': stock_name,
+                    'code': stock_code,
+                    'emoji': status_emoji,
+                    'eval_amount': self.format_currency(eval_amount),
+                    'avg_price': self.format_currency(avg_price),
+                    'quantity': quantity,
+                    'profit_sign': profit_sign,
+                    'profit_amount': self.format_currency(profit_amount),
+                    'profit_rate': self.format_percentage(profit_rate),
+                }))
 
         else:
-            message += "📭 *보유종목*: 없음\n\n"
+            buf.write("📭 *보유종목*: 없음\n\n")
 
-        return message
+        return buf.getvalue()
 
 
+    async def _safe_send(self, chat_id: str, message: str) -> bool:
+        """Send a telegram message under the shared rate limiter"""
+        async with self._tg_limiter:
+            return await self.telegram_bot.send_message(chat_id, message)
+
+    def _get_trader(self) -> DomesticStockTrading:
+        """Return the shared trading client, creating it on first use"""
+        if self._trader is None:
+            self._trader = DomesticStockTrading(mode=self.trading_mode)
+        return self._trader
+
+    def close(self):
+        """Dispose the shared trading client"""
+        self._trader = None
+
+    async def prewarm(self):
+        """
+        Best-effort warm-up before the first real request
+
+        Creating the trader primes KIS auth/token setup, so cold-start
+        latency is paid here instead of on the first report. Failures are
+        ignored. (The translator is deliberately not warmed: each
+        translation call builds a fresh agent and LLM client, so a dummy
+        call would reuse nothing and just burn a paid LLM round-trip.)
+        """
+        try:
+            await asyncio.to_thread(self._get_trader)
+        except Exception as e:
+            logger.debug(f"Prewarm step failed (ignored): {e}")
+
     async def get_trading_data(self) -> tuple:
         """
         Fetch trading data
@@ -219,13 +378,15 @@ class PortfolioTelegramReporter:
             (portfolio, account_summary) tuple
         """
         try:
-            trader = DomesticStockTrading(mode=self.trading_mode)
-
-            logger.info("Fetching portfolio data...")
-            portfolio = trader.get_portfolio()
+            trader = self._get_trader()
 
-            logger.info("Fetching account summary...")
-            account_summary = trader.get_account_summary()
+            # The two REST calls are independent and synchronous - run them
+            # in threads so they overlap and never block the event loop
+            logger.info("Fetching portfolio and account summary...")
+            portfolio, account_summary = await asyncio.gather(
+                asyncio.to_thread(trader.get_portfolio),
+                asyncio.to_thread(trader.get_account_summary)
+            )
 
             logger.info(f"Data fetch complete: {len(portfolio)} holdings")
             return portfolio, account_summary
@@ -234,6 +395,20 @@ class PortfolioTelegramReporter:
             logger.error(f"Error fetching trading data: {str(e)}")
             return [], {}
 
+    async def _get_account_summary(self) -> Dict[str, Any]:
+        """
+        Fetch only the account summary (skips the portfolio request)
+
+        Returns:
+            Account summary data
+        """
+        try:
+            trader = self._get_trader()
+            return await asyncio.to_thread(trader.get_account_summary)
+        except Exception as e:
+            logger.error(f"Error fetching account summary: {str(e)}")
+            return {}
+
     async def send_portfolio_report(self) -> bool:
         """
         Send portfolio report to Telegram
@@ -252,7 +427,7 @@ class PortfolioTelegramReporter:
 
             logger.info("Sending telegram message...")
             # Send to main channel
-            success = await self.telegram_bot.send_message(self.chat_id, message)
+            success = await self._safe_send(self.chat_id, message)
 
             if success:
                 logger.info("Portfolio report sent successfully!")
@@ -269,44 +444,101 @@ class PortfolioTelegramReporter:
             logger.error(f"Error sending portfolio report: {str(e)}")
             return False
 
+    @staticmethod
+    def _translation_cache_path(message: str, lang: str) -> Path:
+        """Cache file path keyed by the content hash of (lang, message) with the timestamp normalized"""
+        stable_message = _REPORT_TIME_RE.sub(_REPORT_TIME_PLACEHOLDER, message)
+        key = hashlib.sha1(f"{lang}|{stable_message}".encode()).hexdigest()
+        return TRANSLATION_CACHE_DIR / f"{key}.txt"
+
+    def _translation_cache_get(self, message: str, lang: str):
+        """Return the cached translation if present and fresh, else None"""
+        cache_path = self._translation_cache_path(message, lang)
+        try:
+            if cache_path.exists() and time.time() - cache_path.stat().st_mtime < TRANSLATION_CACHE_TTL_SEC:
+                logger.info(f"Translation cache hit for {lang}")
+                cached = cache_path.read_text(encoding='utf-8')
+                # Refresh the timestamp line - the numeric MM/DD HH:MM format
+                # survives translation unchanged
+                current_time = datetime.datetime.now().strftime("%m/%d %H:%M")
+                return _REPORT_TIME_RE.sub(f"🕐 {current_time}", cached)
+        except Exception as e:
+            logger.debug(f"Translation cache read failed: {e}")
+        return None
+
+    def _translation_cache_put(self, message: str, lang: str, translated: str):
+        try:
+            TRANSLATION_CACHE_DIR.mkdir(exist_ok=True)
+
+            # Prune expired entries so the cache directory stays bounded
+            now = time.time()
+            for entry in TRANSLATION_CACHE_DIR.glob("*.txt"):
+                try:
+                    if now - entry.stat().st_mtime >= TRANSLATION_CACHE_TTL_SEC:
+                        entry.unlink()
+                except OSError:
+                    pass
+
+            self._translation_cache_path(message, lang).write_text(translated, encoding='utf-8')
+        except Exception as e:
+            logger.debug(f"Translation cache write failed: {e}")
+
     async def _send_translated_portfolio_report(self, original_message: str):
         """
         Send translated portfolio report to additional language channels
 
+        All uncached languages are translated in a single batched LLM call,
+        then the sends fan out concurrently.
+
         Args:
             original_message: Original Korean message
         """
         try:
-            import sys
-            from pathlib import Path
-
-            # Add cores directory to path for importing translator agent
-            cores_path = Path(__file__).parent.parent / "cores"
-            if str(cores_path) not in sys.path:
-                sys.path.insert(0, str(cores_path))
-
-            from agents.telegram_translator_agent import translate_telegram_message
-
+            # Languages with a configured channel
+            langs = []
             for lang in self.broadcast_languages:
+                if self.broadcast_channel_ids.get(lang):
+                    langs.append(lang)
+                else:
+                    logger.warning(f"No channel ID configured for language: {lang}")
+
+            if not langs:
+                return
+
+            # Serve what we can from the on-disk cache
+            translations = {}
+            missing = []
+            for lang in langs:
+                cached = self._translation_cache_get(original_message, lang)
+                if cached is not None:
+                    translations[lang] = cached
+                else:
+                    missing.append(lang)
+
+            # One LLM round-trip for every language still missing
+            if missing:
+                logger.info(f"Translating portfolio report to {missing} in one batch call")
+                fresh = await translate_telegram_message_multi(
+                    original_message,
+                    missing,
+                    model="gpt-5-nano",
+                    from_lang="ko"
+                )
+
+                for lang, translated in fresh.items():
+                    self._translation_cache_put(original_message, lang, translated)
+                translations.update(fresh)
+
+            async def send_one(lang):
                 try:
-                    # Get channel ID for this language
-                    channel_id = self.broadcast_channel_ids.get(lang)
-                    if not channel_id:
-                        logger.warning(f"No channel ID configured for language: {lang}")
-                        continue
-
-                    logger.info(f"Translating portfolio report to {lang}")
-
-                    # Translate message
-                    translated_message = await translate_telegram_message(
-                        original_message,
-                        model="gpt-5-nano",
-                        from_lang="ko",
-                        to_lang=lang
-                    )
+                    translated_message = translations.get(lang)
+                    if not translated_message:
+                        logger.error(f"No translation produced for {lang}")
+                        return
 
-                    # Send translated message
-                    success = await self.telegram_bot.send_message(channel_id, translated_message)
+                    success = await self._safe_send(
+                        self.broadcast_channel_ids[lang], translated_message
+                    )
 
                     if success:
                         logger.info(f"Portfolio report sent successfully to {lang} channel")
@@ -316,6 +548,11 @@ class PortfolioTelegramReporter:
                 except Exception as e:
                     logger.error(f"Error sending portfolio report to {lang}: {str(e)}")
 
+            await asyncio.gather(
+                *(send_one(lang) for lang in langs),
+                return_exceptions=True
+            )
+
         except Exception as e:
             logger.error(f"Error in _send_translated_portfolio_report: {str(e)}")
 
@@ -331,22 +568,14 @@ class PortfolioTelegramReporter:
         """
         try:
             current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            mode_emoji = "🧪" if self.trading_mode == "demo" else "💰"
-
-            # Status message settings
-            status_messages = {
-                "morning": "🌅 **장 시작 전 체크**",
-                "evening": "🌆 **장 마감 후 정리**",
-                "market_close": "🔔 **시장 마감**",
-                "weekend": "🏖️ **주말 상태 체크**"
-            }
 
-            title = status_messages.get(status_type, "📊 **상태 체크**")
+            title = self._STATUS_TITLES.get(status_type, "📊 **상태 체크**")
 
-            # Fetch only account summary
-            _, account_summary = await self.get_trading_data()
+            # Fetch only account summary - status messages never show
+            # holdings, so skip the portfolio round-trip entirely
+            account_summary = await self._get_account_summary()
 
-            message = f"{title} {mode_emoji}\n"
+            message = f"{title} {self.mode_emoji}\n"
             message += f"📅 {current_time}\n\n"
 
             if account_summary:
@@ -363,7 +592,7 @@ class PortfolioTelegramReporter:
 
             message += "\n🤖 자동 상태 체크"
 
-            success = await self.telegram_bot.send_message(self.chat_id, message)
+            success = await self._safe_send(self.chat_id, message)
 
             if success:
                 logger.info(f"{status_type} status message sent successfully!")
@@ -383,7 +612,7 @@ async def main():
 
     parser = argparse.ArgumentParser(description="Portfolio Telegram Reporter")
     parser.add_argument("--mode", choices=["demo", "real"],
-                       help=f"Trading mode (demo: paper trading, real: live trading, default: {_cfg['default_mode']})")
+                       help=f"Trading mode (demo: paper trading, real: live trading, default: {_load_cfg()['default_mode']})")
     parser.add_argument("--type", choices=["full", "simple", "morning", "evening", "market_close", "weekend"],
                        default="full", help="Report type")
     parser.add_argument("--token", help="Telegram bot token")
@@ -405,13 +634,19 @@ async def main():
             broadcast_languages=broadcast_languages
         )
 
+        # Warm KIS trader auth before the first request
+        await reporter.prewarm()
+
         # Execute based on report type
-        if args.type == "full":
-            success = await reporter.send_portfolio_report()
-        else:
-            # Simple or specific status message
-            status_type = args.type if args.type != "simple" else "morning"
-            success = await reporter.send_simple_status(status_type)
+        try:
+            if args.type == "full":
+                success = await reporter.send_portfolio_report()
+            else:
+                # Simple or specific status message
+                status_type = args.type if args.type != "simple" else "morning"
+                success = await reporter.send_simple_status(status_type)
+        finally:
+            reporter.close()
 
         if success:
             logger.info("Program completed successfully")